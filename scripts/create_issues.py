@@ -237,9 +237,7 @@ class IssueCreator:
                 )
             elif path.suffix.lower() == '.txt':
                 # Legacy text format
-                with open(path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                issues_data = self.service.parse_text_format(content)
+                issues_data = self.service.parse_text_file(path)
                 results = self.service.create_issues_bulk(
                     project_id, issues_data, template_name, dry_run
                 )
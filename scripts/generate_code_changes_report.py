@@ -31,6 +31,11 @@ except ImportError:
 if 'GITLAB_API_TOKEN' in os.environ and 'GITLAB_TOKEN' not in os.environ:
     os.environ['GITLAB_TOKEN'] = os.environ['GITLAB_API_TOKEN']
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.session import DEFAULT_TIMEOUT, get_session
+
 # Try to import rich for beautiful table formatting
 try:
     from rich.console import Console
@@ -62,7 +67,7 @@ def get_env_or_exit(key: str, description: str) -> str:
 
 def simple_gitlab_request(url: str, token: str, endpoint: str, params: Dict = None) -> Any:
     """Make a simple GitLab API request with pagination support."""
-    headers = {"Authorization": f"Bearer {token}"}
+    session = get_session(token)
     full_url = f"{url}/api/v4/{endpoint}"
     
     all_results = []
@@ -74,7 +79,7 @@ def simple_gitlab_request(url: str, token: str, endpoint: str, params: Dict = No
             request_params = params or {}
             request_params.update({'page': page, 'per_page': per_page})
             
-            response = requests.get(full_url, headers=headers, params=request_params)
+            response = session.get(full_url, params=request_params, timeout=DEFAULT_TIMEOUT)
             response.raise_for_status()
             
             results = response.json()
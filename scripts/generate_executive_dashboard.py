@@ -52,6 +52,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import our services
 from src.api.client import GitLabClient
+from src.api.session import DEFAULT_TIMEOUT, get_session
 from src.services.group_enhancement import GroupEnhancementService
 from src.services.branch_service import BranchService
 from src.services.issue_service import IssueService
@@ -160,7 +161,7 @@ def simple_gitlab_request(url: str, token: str, endpoint: str, params: Dict = No
     """Make a simple GitLab API request with pagination support."""
     import requests
     
-    headers = {"Authorization": f"Bearer {token}"}
+    session = get_session(token)
     full_url = f"{url}/api/v4/{endpoint}"
     
     all_results = []
@@ -172,7 +173,7 @@ def simple_gitlab_request(url: str, token: str, endpoint: str, params: Dict = No
             request_params = params or {}
             request_params.update({'page': page, 'per_page': per_page})
             
-            response = requests.get(full_url, headers=headers, params=request_params)
+            response = session.get(full_url, params=request_params, timeout=DEFAULT_TIMEOUT)
             response.raise_for_status()
             
             results = response.json()
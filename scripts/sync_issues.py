@@ -9,11 +9,27 @@ GitLab issues using curl commands or the GitLab API.
 import os
 import sys
 import re
-import subprocess
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
+from urllib.parse import quote, unquote
+
+import yaml
+
+# orjson is optional; its decode errors subclass json.JSONDecodeError
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    # libyaml bindings unavailable, use the pure Python loader
+    from yaml import SafeLoader as YamlLoader
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -22,6 +38,15 @@ from src.utils import Config, get_logger
 
 logger = get_logger(__name__)
 
+# Patterns applied to every issue file
+# The heading text must start with a non-blank character on the same line,
+# so the spacing and text parts cannot overlap and never backtrack
+_HEADING_RE = re.compile(r'^#[ \t]+(\S.*)$', re.MULTILINE)
+_HASHTAG_RE = re.compile(r'#(\w+)')
+
+# File extensions treated as issue files
+ISSUE_FILE_SUFFIXES = ('.md', '.txt', '.markdown')
+
 
 class IssueFile:
     """Represents an issue file with metadata and content."""
@@ -42,24 +67,25 @@ class IssueFile:
     
     def _parse_file(self):
         """Parse markdown file for issue content and metadata."""
-        with open(self.filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # utf-8-sig drops a leading BOM so frontmatter detection still works
+        content = self.filepath.read_bytes().decode('utf-8-sig')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n')
         
-        # Check for YAML frontmatter
+        # Check for YAML frontmatter, closed by the next '---' line
+        body = content
         if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
-                self._parse_frontmatter(parts[1])
-                body = parts[2].strip()
-            else:
-                body = content
-        else:
-            body = content
+            start = content.find('\n') + 1
+            end = content.find('\n---', start - 1) if start else -1
+            if end != -1:
+                self._parse_frontmatter(content[start:end + 1])
+                _, _, rest = content[end + 1:].partition('\n')
+                body = rest.strip()
         
         # If no title in frontmatter, use first heading or filename
         if not self.title:
             # Try to find first heading
-            heading_match = re.search(r'^#\s+(.+)$', body, re.MULTILINE)
+            heading_match = _HEADING_RE.search(body) if '#' in body else None
             if heading_match:
                 self.title = heading_match.group(1).strip()
                 # Remove the heading from body
@@ -71,17 +97,16 @@ class IssueFile:
         self.description = body.strip()
         
         # Extract labels from hashtags in content
-        hashtags = re.findall(r'#(\w+)', body)
+        hashtags = _HASHTAG_RE.findall(body) if '#' in body else []
         self.labels.extend(hashtags)
         
-        # Remove duplicate labels
-        self.labels = list(set(self.labels))
+        # Remove duplicate labels, keeping first-seen order
+        self.labels = list(dict.fromkeys(self.labels))
     
     def _parse_frontmatter(self, frontmatter: str):
         """Parse YAML frontmatter for metadata."""
-        import yaml
         try:
-            data = yaml.safe_load(frontmatter)
+            data = yaml.load(frontmatter, Loader=YamlLoader)
             if data:
                 self.title = data.get('title', '')
                 self.labels = data.get('labels', [])
@@ -125,28 +150,48 @@ def get_issue_files(issues_dir: Path) -> List[IssueFile]:
     """Get all issue files from the issues directory."""
     issue_files = []
     
-    # Support .md and .txt files
-    for pattern in ['*.md', '*.txt', '*.markdown']:
-        for filepath in issues_dir.glob(pattern):
-            if filepath.is_file():
-                try:
-                    issue_file = IssueFile(filepath)
-                    issue_files.append(issue_file)
-                    logger.info(f"Loaded issue: {issue_file.title}")
-                except Exception as e:
-                    logger.error(f"Failed to parse {filepath}: {e}")
+    # Support .md and .txt files, collected in a single directory scan;
+    # dotfiles (drafts, editor backups) are skipped, as glob() did
+    with os.scandir(issues_dir) as entries:
+        filepaths = sorted(
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(ISSUE_FILE_SUFFIXES)
+            and not entry.name.startswith('.')
+            and entry.is_file()
+        )
+    
+    for filepath in filepaths:
+        try:
+            issue_file = IssueFile(filepath)
+            issue_files.append(issue_file)
+            logger.info(f"Loaded issue: {issue_file.title}")
+        except Exception as e:
+            logger.error(f"Failed to parse {filepath}: {e}")
     
     return issue_files
 
 
+def build_issues_url(gitlab_url: str, project_id: str) -> str:
+    """Build the REST issues endpoint, URL-encoding path-style project IDs.
+    
+    IDs that are already encoded (``group%2Fproject``) are decoded first so
+    they aren't encoded twice.
+    """
+    return f"{gitlab_url}/api/v4/projects/{quote(unquote(str(project_id)), safe='')}/issues"
+
+
 def generate_curl_command(
     issue: IssueFile,
     gitlab_url: str,
     project_id: str,
-    token: str
+    token: str,
+    api_url: Optional[str] = None
 ) -> str:
-    """Generate curl command for creating an issue."""
-    api_url = f"{gitlab_url}/api/v4/projects/{project_id}/issues"
+    """Generate curl command for creating an issue.
+    
+    Pass a precomputed ``api_url`` when generating commands for many issues.
+    """
+    api_url = api_url or build_issues_url(gitlab_url, project_id)
     
     # Build curl command
     cmd_parts = [
@@ -171,10 +216,14 @@ def create_issue_with_curl(
     gitlab_url: str,
     project_id: str,
     token: str,
-    dry_run: bool = False
+    dry_run: bool = False,
+    api_url: Optional[str] = None
 ) -> Tuple[bool, str]:
-    """Create issue using curl command."""
-    api_url = f"{gitlab_url}/api/v4/projects/{project_id}/issues"
+    """Create issue using curl command.
+    
+    Pass a precomputed ``api_url`` when creating many issues.
+    """
+    api_url = api_url or build_issues_url(gitlab_url, project_id)
     
     # Build curl command as list for subprocess
     cmd = [
@@ -195,26 +244,41 @@ def create_issue_with_curl(
         # Just return the command that would be executed
         return True, ' '.join(cmd)
     
+    # Only needed when curl actually runs, so dry runs and API mode skip it
+    import subprocess
+    
+    # Append the HTTP status on its own line so failures can be detected
+    # without a second parse of the response body
+    cmd.extend(['--write-out', '\n%{http_code}'])
+    
     try:
         # Execute curl command
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            return False, f"Curl failed: {result.stderr}"
+        
+        body, _, status = result.stdout.rpartition('\n')
+        
+        # Parse response; error pages (e.g. an HTML 502 from a proxy) aren't JSON
+        try:
+            response = json_loads(body)
+        except json.JSONDecodeError:
+            response = None
+        
+        if not status.isdigit() or int(status) >= 400:
+            error = body.strip() or 'empty response'
+            if isinstance(response, dict):
+                error = response.get('message') or response.get('error') or error
+            return False, f"HTTP {status}: {error}"
+        
+        if not isinstance(response, dict):
+            return False, f"Invalid response (HTTP {status}): {body}"
         
-        # Parse response
-        response = json.loads(result.stdout)
         issue_url = response.get('web_url', '')
         issue_id = response.get('iid', '')
         
         return True, f"Created issue #{issue_id}: {issue_url}"
         
-    except subprocess.CalledProcessError as e:
-        return False, f"Curl failed: {e.stderr}"
-    except json.JSONDecodeError:
-        return False, f"Invalid response: {result.stdout}"
     except Exception as e:
         return False, f"Error: {str(e)}"
 
@@ -224,16 +288,22 @@ def create_issue_with_api(
     gitlab_url: str,
     project_id: str,
     token: str,
-    dry_run: bool = False
+    dry_run: bool = False,
+    client: Optional[Any] = None
 ) -> Tuple[bool, str]:
-    """Create issue using GitLab API directly."""
+    """Create issue using GitLab API directly.
+    
+    Pass a shared ``client`` when creating several issues so its pooled
+    session (and authentication check) is reused instead of recreated.
+    """
     if dry_run:
         return True, f"Would create issue: {issue.title}"
     
     try:
-        from src.api import GitLabClient
-        
-        client = GitLabClient(url=gitlab_url, token=token)
+        if client is None:
+            from src.api import GitLabClient
+            
+            client = GitLabClient(url=gitlab_url, token=token)
         
         # Create issue
         response = client.create_issue(
@@ -250,6 +320,92 @@ def create_issue_with_api(
         return False, f"API Error: {str(e)}"
 
 
+def _graphql_issue_input(issue: IssueFile) -> Optional[Dict[str, Any]]:
+    """Map an issue file onto ``create_issues_batch`` input.
+    
+    GraphQL takes global IDs for the milestone and assignees, so those are
+    only mapped when given as numeric IDs. Returns None when a milestone,
+    assignee or weight can't be mapped; such issues go through REST.
+    """
+    data = {
+        'title': issue.title,
+        'description': issue.description,
+        'labels': issue.labels,
+        'due_date': issue.due_date
+    }
+    
+    for attr in ('weight', 'milestone', 'assignee'):
+        value = getattr(issue, attr)
+        if value and not str(value).isdigit():
+            return None
+    
+    if issue.weight:
+        data['weight'] = int(issue.weight)
+    if issue.milestone:
+        data['milestone_id'] = int(issue.milestone)
+    if issue.assignee:
+        data['assignee_ids'] = [int(issue.assignee)]
+    
+    return data
+
+
+def _create_graphql_run(
+    run: List[Dict[str, Any]],
+    project_path: str,
+    client: Any
+) -> List[Tuple[bool, str]]:
+    """Create a run of GraphQL issue inputs in one mutation."""
+    if not run:
+        return []
+    try:
+        payloads = client.create_issues_batch(project_path, run)
+    except Exception as e:
+        payloads = [{'issue': None, 'errors': [str(e)]}] * len(run)
+    
+    outcomes = []
+    for payload in payloads:
+        created = payload.get('issue')
+        if created:
+            outcomes.append((True, f"Created issue #{created['iid']}: {created['webUrl']}"))
+        else:
+            outcomes.append((False, f"API Error: {'; '.join(payload.get('errors') or ['Unknown error'])}"))
+    return outcomes
+
+
+def create_issues_with_graphql(
+    issues: List[IssueFile],
+    project_path: str,
+    client: Any,
+    project_id: Optional[str] = None
+) -> List[Tuple[bool, str]]:
+    """Create a batch of issues with GraphQL, keeping file order.
+    
+    Issues whose milestone or assignee is given by name are created one by
+    one through REST on ``project_id`` (defaults to ``project_path``). The
+    batch is split at each of them, so every issue is created in input
+    order and GitLab numbers them accordingly.
+    
+    Returns one (success, message) outcome per issue, in input order.
+    """
+    outcomes = []
+    run = []
+    for issue in issues:
+        item = _graphql_issue_input(issue)
+        if item is not None:
+            run.append(item)
+            continue
+        
+        outcomes.extend(_create_graphql_run(run, project_path, client))
+        run = []
+        outcomes.append(create_issue_with_api(
+            issue, gitlab_url=None, project_id=project_id or project_path,
+            token=None, client=client
+        ))
+    
+    outcomes.extend(_create_graphql_run(run, project_path, client))
+    return outcomes
+
+
 def sync_issues(
     issues_dir: Path,
     gitlab_url: str,
@@ -257,9 +413,21 @@ def sync_issues(
     token: str,
     use_curl: bool = True,
     dry_run: bool = False,
-    generate_script: bool = False
+    generate_script: bool = False,
+    max_workers: int = 1,
+    batch_size: int = 1
 ) -> Dict[str, any]:
-    """Sync all issues from directory to GitLab."""
+    """Sync all issues from directory to GitLab.
+    
+    With ``max_workers`` > 1 issues are created concurrently on a thread
+    pool; GitLab then assigns issue numbers in completion order rather
+    than file order.
+    
+    In API mode a ``batch_size`` > 1 creates issues through GraphQL, one
+    request per batch, in file order; this takes precedence over
+    ``max_workers``. Issues whose milestone or assignee is a name rather
+    than a numeric ID still go through REST.
+    """
     results = {
         'total': 0,
         'success': 0,
@@ -277,41 +445,58 @@ def sync_issues(
     
     print(f"\nFound {len(issue_files)} issue files to process\n")
     
+    # The endpoint is the same for every issue
+    api_url = build_issues_url(gitlab_url, project_id)
+    
     # Generate shell script if requested
     if generate_script:
         script_path = issues_dir / 'create_issues.sh'
+        parts = [
+            "#!/bin/bash\n",
+            "# GitLab Issue Creation Script\n",
+            f"# Generated from markdown files in {issues_dir}\n\n"
+        ]
+        for issue in issue_files:
+            parts.append(f"echo 'Creating issue: {issue.title}'\n")
+            parts.append(generate_curl_command(issue, gitlab_url, project_id, token, api_url))
+            parts.append("\n\n")
+        
+        # Build the script in memory and write it out in one call
         with open(script_path, 'w') as f:
-            f.write("#!/bin/bash\n")
-            f.write("# GitLab Issue Creation Script\n")
-            f.write(f"# Generated from markdown files in {issues_dir}\n\n")
-            
-            for issue in issue_files:
-                f.write(f"echo 'Creating issue: {issue.title}'\n")
-                f.write(generate_curl_command(issue, gitlab_url, project_id, token))
-                f.write("\n\n")
+            f.write(''.join(parts))
         
         os.chmod(script_path, 0o755)
         print(f"Generated script: {script_path}")
         return results
     
-    # Process each issue
-    for i, issue_file in enumerate(issue_files, 1):
+    # Share one API client (keep-alive session, single auth check) across issues
+    api_client = None
+    if not use_curl and not dry_run:
+        from src.api import GitLabClient
+        
+        try:
+            api_client = GitLabClient(url=gitlab_url, token=token)
+        except Exception as e:
+            logger.error(f"Failed to initialize GitLab client: {e}")
+    
+    def create(issue_file: IssueFile) -> Tuple[bool, str]:
+        if use_curl:
+            return create_issue_with_curl(
+                issue_file, gitlab_url, project_id, token, dry_run, api_url
+            )
+        return create_issue_with_api(
+            issue_file, gitlab_url, project_id, token, dry_run,
+            client=api_client
+        )
+    
+    def report(i: int, issue_file: IssueFile, outcome: Tuple[bool, str]) -> None:
+        success, message = outcome
         print(f"[{i}/{len(issue_files)}] Processing: {issue_file.filename}")
         print(f"  Title: {issue_file.title}")
         
         if issue_file.labels:
             print(f"  Labels: {', '.join(issue_file.labels)}")
         
-        # Create issue
-        if use_curl:
-            success, message = create_issue_with_curl(
-                issue_file, gitlab_url, project_id, token, dry_run
-            )
-        else:
-            success, message = create_issue_with_api(
-                issue_file, gitlab_url, project_id, token, dry_run
-            )
-        
         if success:
             results['success'] += 1
             print(f"  ✓ {message}")
@@ -322,6 +507,31 @@ def sync_issues(
         
         print()
     
+    # GraphQL mutations need the full project path rather than a numeric ID
+    project_path = None
+    if api_client is not None and batch_size > 1:
+        try:
+            project_path = api_client.get_project(project_id)['path_with_namespace'] \
+                if str(project_id).isdigit() else project_id
+        except Exception as e:
+            logger.error(f"Failed to resolve project path, creating issues one by one: {e}")
+    
+    # Process each issue; results are reported from this thread only
+    if project_path:
+        for start in range(0, len(issue_files), batch_size):
+            batch = issue_files[start:start + batch_size]
+            outcomes = create_issues_with_graphql(batch, project_path, api_client, project_id)
+            for i, (issue_file, outcome) in enumerate(zip(batch, outcomes), start + 1):
+                report(i, issue_file, outcome)
+    elif max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(create, issue_file): issue_file for issue_file in issue_files}
+            for i, future in enumerate(as_completed(futures), 1):
+                report(i, futures[future], future.result())
+    else:
+        for i, issue_file in enumerate(issue_files, 1):
+            report(i, issue_file, create(issue_file))
+    
     return results
 
 
@@ -389,6 +599,20 @@ Implement a secure user authentication system with the following features:
         help='Generate a shell script with curl commands'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of issues to create concurrently (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=1,
+        help='Issues per GraphQL request in API mode (default: 1, no batching)'
+    )
+    
     parser.add_argument(
         '--config',
         help='Configuration file path'
@@ -427,7 +651,9 @@ Implement a secure user authentication system with the following features:
             token=token,
             use_curl=not args.use_api,
             dry_run=args.dry_run,
-            generate_script=args.generate_script
+            generate_script=args.generate_script,
+            max_workers=args.workers,
+            batch_size=args.batch_size
         )
         
         # Print summary
@@ -15,7 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.api import GitLabClient
 from src.services.weekly_reports import WeeklyProductivityReporter
 from src.services.email_service import WeeklyReportEmailSender
-from src.templates.weekly_report_email import WeeklyReportEmailTemplate
+from src.templates.weekly_report_email import render_weekly_report_email
 from src.utils import Config, setup_logging, get_logger
 from src.utils.logger import Colors
 
@@ -378,8 +378,7 @@ def save_report_to_file(report_data: Dict[str, Any], output_path: Path, format_t
         logger.info(f"Report saved as JSON: {output_path}")
     
     elif format_type == 'html':
-        template = WeeklyReportEmailTemplate()
-        html_content = template.generate_html_email(report_data)
+        html_content = render_weekly_report_email(report_data)
         
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
@@ -2,5 +2,6 @@
 
 from .client import GitLabClient
 from .exceptions import GitLabAPIError, RateLimitError, AuthenticationError
+from .session import get_session
 
-__all__ = ['GitLabClient', 'GitLabAPIError', 'RateLimitError', 'AuthenticationError']
\ No newline at end of file
+__all__ = ['GitLabClient', 'GitLabAPIError', 'RateLimitError', 'AuthenticationError', 'get_session']
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 import time
 import logging
+import threading
 from typing import Dict, List, Any, Optional, Iterator, Union
 from urllib.parse import urljoin, urlparse
 import requests
@@ -27,18 +28,20 @@ class RateLimiter:
         self.requests_per_second = requests_per_second
         self.min_interval = 1.0 / requests_per_second
         self.last_request_time = 0
+        self._lock = threading.Lock()
     
     def wait_if_needed(self):
-        """Wait if necessary to respect rate limit."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.min_interval:
-            sleep_time = self.min_interval - time_since_last_request
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        """Wait if necessary to respect rate limit (safe to call from multiple threads)."""
+        with self._lock:
+            current_time = time.time()
+            time_since_last_request = current_time - self.last_request_time
+            
+            if time_since_last_request < self.min_interval:
+                sleep_time = self.min_interval - time_since_last_request
+                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+                time.sleep(sleep_time)
+            
+            self.last_request_time = time.time()
 
 
 class GitLabClient:
@@ -60,6 +63,7 @@ class GitLabClient:
             verify_ssl: Whether to verify SSL certificates
         """
         self.base_url = f"{url.rstrip('/')}/api/v4"
+        self.graphql_url = f"{url.rstrip('/')}/api/graphql"
         self.token = token
         self.verify_ssl = verify_ssl
         self.config = config or {}
@@ -71,11 +75,19 @@ class GitLabClient:
         # Setup session with retry logic
         self.session = self._create_session()
         
+        # Mutations aren't idempotent, so a retried POST could apply them twice
+        self.mutation_session = self._create_session(retry=False)
+        
         # Test authentication
         self._verify_authentication()
     
-    def _create_session(self) -> requests.Session:
-        """Create a requests session with retry logic and connection pooling."""
+    def _create_session(self, retry: bool = True) -> requests.Session:
+        """Create a requests session with retry logic and connection pooling.
+        
+        Args:
+            retry: Whether to retry failed requests; pass False for sessions
+                that send non-idempotent requests such as GraphQL mutations
+        """
         session = requests.Session()
         
         # Set headers
@@ -87,7 +99,7 @@ class GitLabClient:
         
         # Configure retry strategy
         retry_strategy = Retry(
-            total=self.config.get('retry_count', 3),
+            total=self.config.get('retry_count', 3) if retry else 0,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"]
@@ -116,6 +128,7 @@ class GitLabClient:
         self, 
         method: str, 
         endpoint: str, 
+        retry: bool = True,
         **kwargs
     ) -> Union[Dict, List]:
         """Make a request to the GitLab API.
@@ -123,6 +136,7 @@ class GitLabClient:
         Args:
             method: HTTP method
             endpoint: API endpoint (relative to base URL)
+            retry: Whether transient failures may be retried
             **kwargs: Additional arguments for requests
             
         Returns:
@@ -143,7 +157,8 @@ class GitLabClient:
         
         # Make request
         try:
-            response = self.session.request(
+            session = self.session if retry else self.mutation_session
+            response = session.request(
                 method, 
                 url, 
                 verify=self.verify_ssl,
@@ -194,6 +209,50 @@ class GitLabClient:
         """
         return self._request('GET', endpoint, **kwargs)
     
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict:
+        """Run a query or mutation against the GitLab GraphQL API.
+        
+        Args:
+            query: GraphQL document
+            variables: Optional variables referenced by the document
+            
+        Returns:
+            The ``data`` member of the response
+            
+        Raises:
+            GitLabAPIError: On request errors or top-level GraphQL errors
+        """
+        response = self._graphql_request(query, variables)
+        
+        if response.get('errors'):
+            raise GitLabAPIError(
+                f"GraphQL request failed: {self._graphql_messages(response['errors'])}",
+                response_data=response
+            )
+        
+        return response.get('data') or {}
+    
+    def _graphql_request(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        retry: bool = True
+    ) -> Dict:
+        """POST a GraphQL document and return the raw response body.
+        
+        Pass ``retry=False`` for mutations, which must not be sent twice.
+        """
+        payload = {'query': query}
+        if variables:
+            payload['variables'] = variables
+        
+        return self._request('POST', self.graphql_url, retry=retry, json=payload)
+    
+    @staticmethod
+    def _graphql_messages(errors: List[Dict]) -> str:
+        """Join GraphQL error entries into one message."""
+        return '; '.join(error.get('message', str(error)) for error in errors)
+    
     def _paginated_get(
         self, 
         endpoint: str, 
@@ -445,6 +504,93 @@ class GitLabClient:
         
         return self._request('POST', f'projects/{project_id}/issues', json=data)
     
+    def create_issues_batch(
+        self,
+        project_path: str,
+        issues: List[Dict[str, Any]]
+    ) -> List[Dict]:
+        """Create several issues with a single GraphQL mutation.
+        
+        Each issue becomes an aliased ``createIssue`` field, so the whole
+        batch costs one HTTP round trip instead of one per issue.
+        
+        Args:
+            project_path: Full project path (e.g. 'group/project')
+            issues: Issue dicts with 'title' and optional 'description',
+                'labels' (list of names), 'due_date' (YYYY-MM-DD), 'weight',
+                'milestone_id' and 'assignee_ids' (numeric IDs)
+            
+        Returns:
+            One ``createIssue`` payload per issue, in input order, each with
+            'issue' ({'iid', 'webUrl'} or None) and 'errors' (list of messages).
+            GraphQL resolves aliases independently, so some issues may be
+            created while others fail.
+            
+        Raises:
+            GitLabAPIError: On request errors, or when the response carries
+                no data at all
+        """
+        if not issues:
+            return []
+        
+        declarations = []
+        fields = []
+        variables = {}
+        
+        for i, issue in enumerate(issues):
+            issue_input = {'projectPath': project_path, 'title': issue['title']}
+            if issue.get('description'):
+                issue_input['description'] = issue['description']
+            if issue.get('labels'):
+                issue_input['labels'] = list(issue['labels'])
+            if issue.get('due_date'):
+                issue_input['dueDate'] = str(issue['due_date'])
+            if issue.get('weight'):
+                issue_input['weight'] = int(issue['weight'])
+            if issue.get('milestone_id'):
+                issue_input['milestoneId'] = f"gid://gitlab/Milestone/{issue['milestone_id']}"
+            if issue.get('assignee_ids'):
+                issue_input['assigneeIds'] = [f"gid://gitlab/User/{user_id}"
+                                              for user_id in issue['assignee_ids']]
+            
+            variables[f'i{i}'] = issue_input
+            declarations.append(f'$i{i}: CreateIssueInput!')
+            fields.append(f'i{i}: createIssue(input: $i{i}) {{ issue {{ iid webUrl }} errors }}')
+        
+        mutation = f"mutation({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+        response = self._graphql_request(mutation, variables, retry=False)
+        
+        data = response.get('data')
+        errors = response.get('errors') or []
+        if data is None:
+            raise GitLabAPIError(
+                f"GraphQL request failed: {self._graphql_messages(errors) or 'no data returned'}",
+                response_data=response
+            )
+        
+        # Top-level errors name the failing alias as the first path element
+        alias_errors = {}
+        for error in errors:
+            path = error.get('path') or [None]
+            alias_errors.setdefault(path[0], []).append(error.get('message', str(error)))
+        
+        results = []
+        failed = []
+        for i in range(len(issues)):
+            alias = f'i{i}'
+            result = data.get(alias)
+            if not result:
+                messages = alias_errors.get(alias) or alias_errors.get(None) or ['No result returned']
+                result = {'issue': None, 'errors': messages}
+            if not result.get('issue'):
+                failed.append(alias)
+            results.append(result)
+        
+        if failed:
+            logger.warning(f"GraphQL batch: {len(failed)} of {len(issues)} issues failed ({', '.join(failed)})")
+        
+        return results
+    
     def get_issues(
         self,
         project_id: Optional[Union[int, str]] = None,
@@ -0,0 +1,21 @@
+"""Pooled HTTP sessions for lightweight GitLab REST calls from report scripts."""
+
+from functools import lru_cache
+
+import requests
+
+
+# Seconds to wait for GitLab to connect or send data before giving up
+DEFAULT_TIMEOUT = 10
+
+
+@lru_cache(maxsize=None)
+def get_session(token: str) -> requests.Session:
+    """Get a pooled HTTP session for the token, created on first use.
+
+    Sessions don't carry a timeout; pass ``timeout=DEFAULT_TIMEOUT`` on
+    every request so a stalled connection can't hang a report.
+    """
+    session = requests.Session()
+    session.headers.update({"Authorization": f"Bearer {token}"})
+    return session
@@ -307,11 +307,10 @@ class WeeklyReportEmailSender:
             True if email sent successfully, False otherwise
         """
         try:
-            from ..templates.weekly_report_email import WeeklyReportEmailTemplate
+            from ..templates.weekly_report_email import render_weekly_report_email
             
             # Generate HTML content
-            template = WeeklyReportEmailTemplate()
-            html_content = template.generate_html_email(
+            html_content = render_weekly_report_email(
                 report_data=report_data,
                 team_name=team_name,
                 include_charts=include_charts
@@ -1,11 +1,13 @@
 """Issue management service."""
 
 import csv
+import io
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union, Iterator
+from typing import List, Dict, Any, Optional, Union, Iterator, Iterable
 from datetime import datetime, date, timedelta
 import logging
+import re
 from collections import Counter, defaultdict
 
 from ..api import GitLabClient
@@ -17,6 +19,22 @@ from ..utils import ProgressTracker
 
 logger = logging.getLogger(__name__)
 
+# Line separating issues in the legacy text format
+TEXT_SECTION_SEPARATOR = '_' * 40
+
+# Separator lines are matched by pattern so their exact length does not matter;
+# surrounding whitespace is part of the pattern so lines need no strip() first
+_TEXT_SECTION_SEPARATOR_RE = re.compile(r'\s*_{5,}\s*')
+
+# Issue type tag introducing a section title, e.g. "[Feature] Login page"
+_TEXT_TITLE_RE = re.compile(r'\[(Feature|Task|Bug)\]')
+
+# "Field: value" lines within a section
+_TEXT_FIELD_RE = re.compile(r'\s*(Description|Acceptance(?: Criteria)?|Labels):(.*)')
+
+# Comma separating labels, together with the whitespace around it
+_TEXT_LABEL_SPLIT_RE = re.compile(r'\s*,\s*')
+
 
 class IssueService:
     """Service for managing GitLab issues."""
@@ -374,63 +392,95 @@ class IssueService:
         Returns:
             List of parsed issue data
         """
+        # Iterate lines lazily instead of materialising a list of all of them
+        return self._parse_text_lines(io.StringIO(content, newline=None))
+    
+    def parse_text_file(self, file_path: Union[str, Path]) -> List[Dict[str, Any]]:
+        """Parse issues from a legacy text format file.
+        
+        The file is streamed line by line rather than read and split whole.
+        
+        Args:
+            file_path: Path to the text file
+            
+        Returns:
+            List of parsed issue data
+        """
+        path = Path(file_path)
+        
+        # Let open() report a missing file instead of stat-ing it beforehand
+        try:
+            with open(path, 'r', encoding='utf-8-sig') as f:
+                return self._parse_text_lines(f)
+        except FileNotFoundError:
+            raise ValidationError(f"File not found: {path}")
+        except IsADirectoryError:
+            raise ValidationError(f"Not a file: {path}")
+    
+    def _parse_text_lines(self, lines: Iterable[str]) -> List[Dict[str, Any]]:
+        """Parse legacy text format lines in a single pass over the input."""
         issues = []
+        section: List[str] = []
+        
+        for line in lines:
+            if _TEXT_SECTION_SEPARATOR_RE.fullmatch(line):
+                issue_data = self._parse_text_section(section)
+                if issue_data:
+                    issues.append(issue_data)
+                section = []
+            else:
+                section.append(line.rstrip('\n'))
+        
+        issue_data = self._parse_text_section(section)
+        if issue_data:
+            issues.append(issue_data)
         
-        # Split by separator
-        sections = content.split('_' * 40)
+        return issues
+    
+    def _parse_text_section(self, lines: List[str]) -> Optional[Dict[str, Any]]:
+        """Parse one legacy text format section into issue data.
         
-        for section in sections:
-            if not section.strip():
+        Returns:
+            Issue data, or None if the section has no tagged title
+        """
+        issue_data = {}
+        
+        # Parse title
+        for line in lines:
+            match = _TEXT_TITLE_RE.search(line)
+            if match:
+                issue_data['title'] = line[match.end():].strip()
+                issue_data['labels'] = [match.group(1).lower()]
+                break
+        
+        if 'title' not in issue_data:
+            return None
+        
+        # Parse other fields
+        description_parts = []
+        
+        for line in lines:
+            match = _TEXT_FIELD_RE.match(line)
+            if not match:
                 continue
             
-            lines = section.strip().split('\n')
-            issue_data = {}
-            
-            # Parse title
-            for line in lines:
-                if '[Feature]' in line:
-                    issue_data['title'] = line.split('[Feature]')[1].strip()
-                    issue_data['labels'] = ['feature']
-                    break
-                elif '[Task]' in line:
-                    issue_data['title'] = line.split('[Task]')[1].strip()
-                    issue_data['labels'] = ['task']
-                    break
-                elif '[Bug]' in line:
-                    issue_data['title'] = line.split('[Bug]')[1].strip()
-                    issue_data['labels'] = ['bug']
-                    break
-            
-            if 'title' not in issue_data:
+            field, value = match.group(1), match.group(2).strip()
+            if not value:
                 continue
             
-            # Parse other fields
-            description_parts = []
-            
-            for line in lines:
-                if line.strip().startswith('Description:'):
-                    desc = line.split('Description:', 1)[1].strip()
-                    if desc:
-                        description_parts.append(f"## Description\n{desc}")
-                elif line.strip().startswith('Acceptance:') or line.strip().startswith('Acceptance Criteria:'):
-                    acc = line.split(':', 1)[1].strip()
-                    if acc:
-                        description_parts.append(f"## Acceptance Criteria\n{acc}")
-                elif line.strip().startswith('Labels:'):
-                    labels = line.split('Labels:', 1)[1].strip()
-                    if labels:
-                        issue_data['labels'].extend([
-                            label.strip() 
-                            for label in labels.split(',')
-                            if label.strip()
-                        ])
-            
-            if description_parts:
-                issue_data['description'] = '\n\n'.join(description_parts)
-            
-            issues.append(issue_data)
+            if field == 'Description':
+                description_parts.append(f"## Description\n{value}")
+            elif field == 'Labels':
+                issue_data['labels'].extend(
+                    label for label in _TEXT_LABEL_SPLIT_RE.split(value) if label
+                )
+            else:
+                description_parts.append(f"## Acceptance Criteria\n{value}")
         
-        return issues
+        if description_parts:
+            issue_data['description'] = '\n\n'.join(description_parts)
+        
+        return issue_data
     
     def get_project_milestones(
         self, 
@@ -2,7 +2,7 @@
 
 # Weekly report email template available conditionally
 try:
-    from .weekly_report_email import WeeklyReportEmailTemplate
-    __all__ = ['WeeklyReportEmailTemplate']
+    from .weekly_report_email import WeeklyReportEmailTemplate, render_weekly_report_email
+    __all__ = ['WeeklyReportEmailTemplate', 'render_weekly_report_email']
 except ImportError:
     __all__ = []
\ No newline at end of file
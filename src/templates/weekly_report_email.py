@@ -1,90 +1,130 @@
 """HTML email template generator for weekly productivity reports."""
 
 import base64
+import heapq
+from collections import OrderedDict
+from functools import lru_cache
 from io import BytesIO
+from string import Template
+from operator import itemgetter
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
+import re
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of rendered charts kept per template instance
+CHART_CACHE_SIZE = 32
 
-class WeeklyReportEmailTemplate:
-    """Generate professional HTML email templates for weekly reports."""
-    
-    def __init__(self):
-        """Initialize template generator."""
-        self.chart_cache = {}
+# Width of the text-chart bars; rows are sliced from these prebuilt strings
+TEXT_BAR_WIDTH = 20
+_FULL_BAR = '█' * TEXT_BAR_WIDTH
+_EMPTY_BAR = '░' * TEXT_BAR_WIDTH
+
+# Whitespace-only runs between tags (collapsed, not removed, since a space
+# between inline elements renders), source indentation around text, and
+# blocks whose whitespace is significant
+_INTERTAG_WS_RE = re.compile(r'>\s+<')
+_LINE_BREAK_WS_RE = re.compile(r'\s*\n\s*')
+_PRESERVE_WS_RE = re.compile(r'(<style\b.*?</style>|<pre\b.*?</pre>)', re.DOTALL | re.IGNORECASE)
+
+# Translation table for escaping user-controlled text in a single C-level pass
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;',
+})
+
+# Markup for one card in a metrics grid, filled via str.format_map
+_METRIC_CARD = (
+    '<div class="metric-card">'
+    '<div class="metric-value">{value}</div>'
+    '<div class="metric-label">{label}</div>'
+    '</div>'
+)
+
+
+def _render_metric_grid(cards: List[Dict[str, Any]]) -> str:
+    """Render a metrics grid from ``{'value': ..., 'label': ...}`` card dicts."""
+    return '<div class="metrics-grid">' + "".join(_METRIC_CARD.format_map(card) for card in cards) + '</div>'
+
+
+def _escape(value: Any) -> str:
+    """HTML-escape a user-controlled value for interpolation into the email."""
+    return str(value).translate(_HTML_ESCAPE_TABLE)
+
+
+def _minify_html(html: str) -> str:
+    """Collapse source indentation, leaving <style> and <pre> blocks intact."""
+    segments = _PRESERVE_WS_RE.split(html)
+    # re.split with one group alternates: markup, preserved block, markup, ...
+    for i in range(0, len(segments), 2):
+        markup = _INTERTAG_WS_RE.sub('> <', segments[i])
+        segments[i] = _LINE_BREAK_WS_RE.sub(' ', markup)
+    return "".join(segments).strip()
+
+
+@lru_cache(maxsize=512)
+def _render_project_card(
+    name: str,
+    health_status: str,
+    health_score: Any,
+    commits_this_week: int,
+    open_issues: int
+) -> str:
+    """Render a project health card, memoized on the fields it displays."""
+    health_class = f"health-{_escape(health_status)}"
     
-    def generate_html_email(
-        self,
-        report_data: Dict[str, Any],
-        team_name: str = "Development Team",
-        include_charts: bool = True
-    ) -> str:
-        """Generate complete HTML email for weekly report.
-        
-        Args:
-            report_data: Report data from WeeklyProductivityReporter
-            team_name: Name of the team for the report
-            include_charts: Whether to include embedded charts
-            
-        Returns:
-            Complete HTML email content
-        """
-        metadata = report_data.get('metadata', {})
-        executive_summary = report_data.get('executive_summary', {})
-        team_activity = report_data.get('team_activity', {})
-        project_breakdown = report_data.get('project_breakdown', {})
-        individual_metrics = report_data.get('individual_metrics', {})
-        insights = report_data.get('insights_and_actions', {})
-        
-        # Generate charts if requested
-        charts_html = ""
-        if include_charts:
-            charts_html = self._generate_charts_section(report_data)
-        
-        # Get detailed tables if available
-        detailed_tables = report_data.get('detailed_tables', {})
-        detailed_tables_html = ""
-        if detailed_tables:
-            detailed_tables_html = self._generate_detailed_tables_section(detailed_tables)
-        
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Weekly Productivity Report - {team_name}</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        {self._get_email_styles()}
-    </style>
-</head>
-<body>
-    <div class="email-container">
-        {self._generate_header(team_name, metadata)}
-        {self._generate_executive_summary_section(executive_summary)}
-        {self._generate_team_activity_section(team_activity, detailed_tables)}
-        {detailed_tables_html}
-        {self._generate_project_health_section(project_breakdown)}
-        {self._generate_individual_highlights_section(individual_metrics)}
-        {charts_html}
-        {self._generate_insights_section(insights)}
-        {self._generate_footer(metadata)}
-    </div>
-</body>
-</html>
+    return f"""
+        <div class="project-card">
+            <div class="project-name">{_escape(name)}</div>
+            <div class="project-health">
+                <span class="health-badge {health_class}">{_escape(health_status.title())}</span>
+                <span style="font-size: 11px; color: #6c757d;">Score: {health_score}</span>
+            </div>
+            <div class="project-metrics">
+                {commits_this_week} commits • 
+                {open_issues} open issues
+            </div>
+        </div>
         """
-        
-        return html_content.strip()
+
+
+@lru_cache(maxsize=512)
+def _format_iso_date(iso_date: str, fmt: str) -> str:
+    """Format an ISO 8601 date string, memoized across report renders."""
+    if not iso_date:
+        return ""
+    return datetime.fromisoformat(iso_date).strftime(fmt)
+
+
+@lru_cache(maxsize=None)
+def _load_chart_backend() -> Optional[tuple]:
+    """Import the matplotlib/NumPy pieces used for charts exactly once.
     
-    def _get_email_styles(self) -> str:
-        """Get modern shadcn/ui-inspired CSS styles optimized for email clients."""
-        return """
+    Returns:
+        ``(Figure, FigureCanvasAgg, mdates, np)`` or None if matplotlib is
+        not installed. Both outcomes are cached, so later renders skip the
+        import machinery entirely.
+    """
+    try:
+        import matplotlib.dates as mdates
+        import numpy as np
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+    except ImportError:
+        logger.debug("matplotlib not available, using text-based charts")
+        return None
+    
+    return Figure, FigureCanvasAgg, mdates, np
+
+
+# Modern shadcn/ui-inspired CSS for the report email (source form)
+EMAIL_STYLES = """
         /* Modern Design System Variables */
         :root {
             --background: #ffffff;
@@ -525,18 +565,140 @@ class WeeklyReportEmailTemplate:
                 font-size: 16px;
             }
         }
+"""
+
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_CSS_WS_RE = re.compile(r'\s+')
+_CSS_PUNCT_WS_RE = re.compile(r'\s*([{};])\s*')
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = _CSS_COMMENT_RE.sub('', css)
+    css = _CSS_WS_RE.sub(' ', css)
+    return _CSS_PUNCT_WS_RE.sub(r'\1', css).strip()
+
+
+# Minified once at import; every render embeds this frozen string
+_MINIFIED_EMAIL_STYLES = _minify_css(EMAIL_STYLES)
+
+
+# Fixed document skeleton; section fragments are filled in with a single
+# Template.substitute pass
+_EMAIL_SKELETON = Template("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Weekly Productivity Report - ${title_team_name}</title>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
+    <style>
+        ${styles}
+    </style>
+</head>
+<body>
+    <div class="email-container">
+        ${header}
+        ${executive_summary}
+        ${team_activity}
+        ${detailed_tables}
+        ${project_health}
+        ${individual_highlights}
+        ${charts}
+        ${insights}
+        ${footer}
+    </div>
+</body>
+</html>
+""")
+
+
+class WeeklyReportEmailTemplate:
+    """Generate professional HTML email templates for weekly reports.
+    
+    Instances hold the chart cache, reusable figure and PNG buffer, so a
+    long-lived instance (see ``render_weekly_report_email``) amortizes them
+    across renders.
+    """
+    
+    __slots__ = ('chart_cache', '_chart_figure', '_png_buffer', '_render_lock', '_cache_lock')
+    
+    def __init__(self):
+        """Initialize template generator."""
+        self.chart_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._chart_figure = None
+        self._png_buffer = BytesIO()
+        self._render_lock = threading.Lock()
+        # Guards chart_cache separately so cache hits never wait on a render
+        self._cache_lock = threading.Lock()
+    
+    def generate_html_email(
+        self,
+        report_data: Dict[str, Any],
+        team_name: str = "Development Team",
+        include_charts: bool = True
+    ) -> str:
+        """Generate complete HTML email for weekly report.
+        
+        Args:
+            report_data: Report data from WeeklyProductivityReporter
+            team_name: Name of the team for the report
+            include_charts: Whether to include embedded charts
+            
+        Returns:
+            Complete HTML email content
         """
+        metadata = report_data.get('metadata', {})
+        executive_summary = report_data.get('executive_summary', {})
+        team_activity = report_data.get('team_activity', {})
+        project_breakdown = report_data.get('project_breakdown', {})
+        individual_metrics = report_data.get('individual_metrics', {})
+        insights = report_data.get('insights_and_actions', {})
+        
+        # Generate charts if requested
+        charts_html = ""
+        if include_charts:
+            charts_html = self._generate_charts_section(report_data)
+        
+        # Get detailed tables if available
+        detailed_tables = report_data.get('detailed_tables', {})
+        detailed_tables_html = ""
+        if detailed_tables:
+            detailed_tables_html = self._generate_detailed_tables_section(detailed_tables)
+        
+        html_content = _EMAIL_SKELETON.substitute(
+            title_team_name=_escape(team_name),
+            styles=self._get_email_styles(),
+            header=self._generate_header(team_name, metadata),
+            executive_summary=self._generate_executive_summary_section(executive_summary),
+            team_activity=self._generate_team_activity_section(team_activity, detailed_tables),
+            detailed_tables=detailed_tables_html,
+            project_health=self._generate_project_health_section(project_breakdown),
+            individual_highlights=self._generate_individual_highlights_section(individual_metrics),
+            charts=charts_html,
+            insights=self._generate_insights_section(insights),
+            footer=self._generate_footer(metadata)
+        )
+        
+        return _minify_html(html_content)
+    
+    def _get_email_styles(self) -> str:
+        """Get modern shadcn/ui-inspired CSS styles optimized for email clients."""
+        return _MINIFIED_EMAIL_STYLES
     
     def _generate_header(self, team_name: str, metadata: Dict) -> str:
         """Generate modern email header section."""
-        period_start = datetime.fromisoformat(metadata.get('period_start', '')).strftime('%B %d')
-        period_end = datetime.fromisoformat(metadata.get('period_end', '')).strftime('%B %d, %Y')
-        generated_at = datetime.fromisoformat(metadata.get('generated_at', '')).strftime('%Y-%m-%d %H:%M')
+        period_start = _format_iso_date(metadata.get('period_start', ''), '%B %d')
+        period_end = _format_iso_date(metadata.get('period_end', ''), '%B %d, %Y')
+        generated_at = _format_iso_date(metadata.get('generated_at', ''), '%Y-%m-%d %H:%M')
         
         return f"""
         <div class="header">
             <h1>📊 Weekly Productivity Report</h1>
-            <div class="period">{team_name} • {period_start} - {period_end}</div>
+            <div class="period">{_escape(team_name)} • {period_start} - {period_end}</div>
             <div class="generated">Generated on {generated_at}</div>
         </div>
         """
@@ -550,49 +712,33 @@ class WeeklyReportEmailTemplate:
         # Format metrics
         metrics_html = ""
         if key_metrics:
-            metrics_html = f"""
-            <div class="metrics-grid">
-                <div class="metric-card">
-                    <div class="metric-value">{key_metrics.get('total_commits', 0)}</div>
-                    <div class="metric-label">Total Commits</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{key_metrics.get('total_merge_requests', 0)}</div>
-                    <div class="metric-label">Merge Requests</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{key_metrics.get('merge_rate', 0):.1f}%</div>
-                    <div class="metric-label">Merge Rate</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{key_metrics.get('active_contributors', 0)}</div>
-                    <div class="metric-label">Contributors</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{key_metrics.get('healthy_projects', 0)}</div>
-                    <div class="metric-label">Healthy Projects</div>
-                </div>
-            </div>
-            """
+            metrics_html = _render_metric_grid([
+                {'value': key_metrics.get('total_commits', 0), 'label': 'Total Commits'},
+                {'value': key_metrics.get('total_merge_requests', 0), 'label': 'Merge Requests'},
+                {'value': f"{key_metrics.get('merge_rate', 0):.1f}%", 'label': 'Merge Rate'},
+                {'value': key_metrics.get('active_contributors', 0), 'label': 'Contributors'},
+                {'value': key_metrics.get('healthy_projects', 0), 'label': 'Healthy Projects'},
+            ])
         
         # Format highlights and concerns
         status_html = ""
         if highlights or concerns:
-            status_html = "<div style='margin-top: 15px;'>"
+            parts = ["<div style='margin-top: 15px;'>"]
             
             if highlights:
-                status_html += "<div style='margin-bottom: 10px;'><strong>✨ Highlights:</strong><ul style='margin: 5px 0 0 20px;'>"
+                parts.append("<div style='margin-bottom: 10px;'><strong>✨ Highlights:</strong><ul style='margin: 5px 0 0 20px;'>")
                 for highlight in highlights[:3]:  # Limit to top 3
-                    status_html += f"<li style='color: #28a745; margin-bottom: 3px;'>{highlight}</li>"
-                status_html += "</ul></div>"
+                    parts.append(f"<li style='color: #28a745; margin-bottom: 3px;'>{_escape(highlight)}</li>")
+                parts.append("</ul></div>")
             
             if concerns:
-                status_html += "<div><strong>⚠️ Attention Needed:</strong><ul style='margin: 5px 0 0 20px;'>"
+                parts.append("<div><strong>⚠️ Attention Needed:</strong><ul style='margin: 5px 0 0 20px;'>")
                 for concern in concerns[:3]:  # Limit to top 3
-                    status_html += f"<li style='color: #dc3545; margin-bottom: 3px;'>{concern}</li>"
-                status_html += "</ul></div>"
+                    parts.append(f"<li style='color: #dc3545; margin-bottom: 3px;'>{_escape(concern)}</li>")
+                parts.append("</ul></div>")
             
-            status_html += "</div>"
+            parts.append("</div>")
+            status_html = "".join(parts)
         
         return f"""
         <div class="section">
@@ -618,39 +764,31 @@ class WeeklyReportEmailTemplate:
                 detailed_tables['project_contributor_activity']
             )
         
+        if aggregated_contributors:
+            top_contributors_html = self._format_top_contributors_from_tables(aggregated_contributors)
+        else:
+            top_contributors_html = self._format_top_contributors(commits.get('by_author', {}))
+        
+        metrics_grid = _render_metric_grid([
+            {'value': commits.get('total', 0), 'label': 'Commits'},
+            {'value': merge_requests.get('opened', 0), 'label': 'MRs Opened'},
+            {'value': merge_requests.get('merged', 0), 'label': 'MRs Merged'},
+            {'value': issues.get('opened', 0), 'label': 'Issues Created'},
+            {'value': issues.get('closed', 0), 'label': 'Issues Resolved'},
+        ])
+        
         return f"""
         <div class="section">
             <h2 class="section-title">
                 <span class="icon">👥</span>
                 Team Activity
             </h2>
-            <div class="metrics-grid">
-                <div class="metric-card">
-                    <div class="metric-value">{commits.get('total', 0)}</div>
-                    <div class="metric-label">Commits</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{merge_requests.get('opened', 0)}</div>
-                    <div class="metric-label">MRs Opened</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{merge_requests.get('merged', 0)}</div>
-                    <div class="metric-label">MRs Merged</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{issues.get('opened', 0)}</div>
-                    <div class="metric-label">Issues Created</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{issues.get('closed', 0)}</div>
-                    <div class="metric-label">Issues Resolved</div>
-                </div>
-            </div>
+            {metrics_grid}
             
             <div style="margin-top: 15px;">
                 <h4 style="color: #495057; margin-bottom: 8px;">Top Contributors This Week</h4>
                 <div style="font-size: 13px;">
-                    {self._format_top_contributors_from_tables(aggregated_contributors) if aggregated_contributors else self._format_top_contributors(commits.get('by_author', {}))}
+                    {top_contributors_html}
                 </div>
             </div>
         </div>
@@ -665,20 +803,25 @@ class WeeklyReportEmailTemplate:
         critical_projects = [p for p in projects if p['health_status'] == 'critical'][:3]
         healthy_projects = [p for p in projects if p['health_status'] == 'healthy'][:3]
         
-        projects_html = ""
+        parts = []
         if critical_projects:
-            projects_html += "<h4 style='color: #dc3545; margin-bottom: 8px;'>🚨 Needs Attention</h4>"
-            projects_html += "<div class='project-grid'>"
-            for project in critical_projects:
-                projects_html += self._format_project_card(project)
-            projects_html += "</div>"
+            parts.append("<h4 style='color: #dc3545; margin-bottom: 8px;'>🚨 Needs Attention</h4>")
+            parts.append("<div class='project-grid'>")
+            parts.extend(self._format_project_card(project) for project in critical_projects)
+            parts.append("</div>")
         
         if healthy_projects:
-            projects_html += "<h4 style='color: #28a745; margin: 15px 0 8px 0;'>💚 Performing Well</h4>"
-            projects_html += "<div class='project-grid'>"
-            for project in healthy_projects:
-                projects_html += self._format_project_card(project)
-            projects_html += "</div>"
+            parts.append("<h4 style='color: #28a745; margin: 15px 0 8px 0;'>💚 Performing Well</h4>")
+            parts.append("<div class='project-grid'>")
+            parts.extend(self._format_project_card(project) for project in healthy_projects)
+            parts.append("</div>")
+        projects_html = "".join(parts)
+        
+        metrics_grid = _render_metric_grid([
+            {'value': health_summary.get('healthy', 0), 'label': 'Healthy'},
+            {'value': health_summary.get('warning', 0), 'label': 'Warning'},
+            {'value': health_summary.get('critical', 0), 'label': 'Critical'},
+        ])
         
         return f"""
         <div class="section">
@@ -686,20 +829,7 @@ class WeeklyReportEmailTemplate:
                 <span class="icon">🏥</span>
                 Project Health
             </h2>
-            <div class="metrics-grid">
-                <div class="metric-card">
-                    <div class="metric-value">{health_summary.get('healthy', 0)}</div>
-                    <div class="metric-label">Healthy</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{health_summary.get('warning', 0)}</div>
-                    <div class="metric-label">Warning</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{health_summary.get('critical', 0)}</div>
-                    <div class="metric-label">Critical</div>
-                </div>
-            </div>
+            {metrics_grid}
             {projects_html}
         </div>
         """
@@ -709,10 +839,15 @@ class WeeklyReportEmailTemplate:
         contributors = individual_metrics.get('contributors', {})
         team_stats = individual_metrics.get('team_stats', {})
         
-        # Get top performers
-        top_commits = max(contributors.items(), key=lambda x: x[1]['commits'], default=(None, {}))
-        top_productivity = max(contributors.items(), key=lambda x: x[1]['productivity_score'], default=(None, {}))
-        top_collaboration = max(contributors.items(), key=lambda x: x[1]['collaboration_score'], default=(None, {}))
+        # Get top performers in a single pass (first contributor wins ties, as with max())
+        top_commits = top_productivity = top_collaboration = (None, {})
+        for name, metrics in contributors.items():
+            if top_commits[0] is None or metrics['commits'] > top_commits[1]['commits']:
+                top_commits = (name, metrics)
+            if top_productivity[0] is None or metrics['productivity_score'] > top_productivity[1]['productivity_score']:
+                top_productivity = (name, metrics)
+            if top_collaboration[0] is None or metrics['collaboration_score'] > top_collaboration[1]['collaboration_score']:
+                top_collaboration = (name, metrics)
         
         highlights_html = ""
         if top_commits[0]:
@@ -720,111 +855,131 @@ class WeeklyReportEmailTemplate:
             <div style="margin-bottom: 15px;">
                 <h4 style="color: #495057; margin-bottom: 8px;">🌟 Team Highlights</h4>
                 <div style="background: #f8f9fa; padding: 12px; border-radius: 6px; font-size: 13px;">
-                    <div style="margin-bottom: 5px;"><strong>Most Active:</strong> {top_commits[0]} ({top_commits[1]['commits']} commits)</div>
-                    <div style="margin-bottom: 5px;"><strong>Top Productivity:</strong> {top_productivity[0]} (Score: {top_productivity[1]['productivity_score']:.1f})</div>
-                    <div><strong>Best Collaborator:</strong> {top_collaboration[0]} (Score: {top_collaboration[1]['collaboration_score']:.1f})</div>
+                    <div style="margin-bottom: 5px;"><strong>Most Active:</strong> {_escape(top_commits[0])} ({top_commits[1]['commits']} commits)</div>
+                    <div style="margin-bottom: 5px;"><strong>Top Productivity:</strong> {_escape(top_productivity[0])} (Score: {top_productivity[1]['productivity_score']:.1f})</div>
+                    <div><strong>Best Collaborator:</strong> {_escape(top_collaboration[0])} (Score: {top_collaboration[1]['collaboration_score']:.1f})</div>
                 </div>
             </div>
             """
         
+        metrics_grid = _render_metric_grid([
+            {'value': team_stats.get('total_contributors', 0), 'label': 'Active Contributors'},
+            {'value': f"{team_stats.get('avg_commits', 0):.1f}", 'label': 'Avg Commits'},
+            {'value': f"{team_stats.get('avg_productivity', 0):.1f}", 'label': 'Avg Productivity'},
+        ])
+        
         return f"""
         <div class="section">
             <h2 class="section-title">
                 <span class="icon">👤</span>
                 Team Performance
             </h2>
-            <div class="metrics-grid">
-                <div class="metric-card">
-                    <div class="metric-value">{team_stats.get('total_contributors', 0)}</div>
-                    <div class="metric-label">Active Contributors</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{team_stats.get('avg_commits', 0):.1f}</div>
-                    <div class="metric-label">Avg Commits</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{team_stats.get('avg_productivity', 0):.1f}</div>
-                    <div class="metric-label">Avg Productivity</div>
-                </div>
-            </div>
+            {metrics_grid}
             {highlights_html}
         </div>
         """
     
     def _generate_charts_section(self, report_data: Dict) -> str:
         """Generate charts section with embedded chart images."""
-        try:
-            # Try to generate charts using matplotlib
-            import matplotlib.pyplot as plt
-            import matplotlib.dates as mdates
-            from datetime import datetime, timedelta
-            
-            charts_html = '<div class="section"><h2 class="section-title"><span class="icon">📊</span>Visual Analytics</h2>'
-            
-            # Commit activity chart
-            team_activity = report_data.get('team_activity', {})
-            commits_by_day = team_activity.get('commits', {}).get('by_day', {})
-            
-            if commits_by_day:
-                chart_html = self._create_commits_chart(commits_by_day)
-                if chart_html:
-                    charts_html += chart_html
-            
-            charts_html += '</div>'
-            return charts_html
-            
-        except ImportError:
+        if _load_chart_backend() is None:
             # Fallback: text-based charts
             return self._generate_text_charts_section(report_data)
+        
+        charts_html = '<div class="section"><h2 class="section-title"><span class="icon">📊</span>Visual Analytics</h2>'
+        
+        # Commit activity chart
+        team_activity = report_data.get('team_activity', {})
+        commits_by_day = team_activity.get('commits', {}).get('by_day', {})
+        
+        if commits_by_day:
+            chart_html = self._create_commits_chart(commits_by_day)
+            if chart_html:
+                charts_html += chart_html
+        
+        charts_html += '</div>'
+        return charts_html
+    
+    def _get_chart_figure(self):
+        """Get the reusable Agg-backed figure used for chart rendering.
+        
+        Rendering through ``Figure``/``FigureCanvasAgg`` directly bypasses
+        pyplot's global state and GUI backend selection.
+        """
+        if self._chart_figure is None:
+            Figure, FigureCanvasAgg, _, _ = _load_chart_backend()
+            self._chart_figure = Figure(figsize=(10, 4))
+            FigureCanvasAgg(self._chart_figure)
+        return self._chart_figure
     
     def _create_commits_chart(self, commits_by_day: Dict) -> str:
-        """Create embedded commit activity chart."""
+        """Create embedded commit activity chart.
+        
+        Rendered charts are cached by their ``(date, count)`` series so that
+        re-rendering the same report (previews, resends) skips matplotlib.
+        """
+        cache_key = tuple(sorted(commits_by_day.items()))
+        with self._cache_lock:
+            cached = self.chart_cache.get(cache_key)
+            if cached is not None:
+                self.chart_cache.move_to_end(cache_key)
+                return cached
+        
+        backend = _load_chart_backend()
+        if backend is None:
+            return ""
+        _, _, mdates, np = backend
+        
         try:
-            import matplotlib.pyplot as plt
-            import matplotlib.dates as mdates
-            from datetime import datetime
-            
             # Prepare data
-            dates = []
-            commits = []
-            for date_str, count in sorted(commits_by_day.items()):
-                dates.append(datetime.strptime(date_str, '%Y-%m-%d'))
-                commits.append(count)
-            
-            if not dates:
+            items = sorted(commits_by_day.items())
+            if not items:
                 return ""
             
-            # Create chart
-            plt.style.use('default')
-            fig, ax = plt.subplots(figsize=(10, 4))
-            ax.plot(dates, commits, marker='o', linewidth=2, markersize=6, color='#667eea')
-            ax.fill_between(dates, commits, alpha=0.3, color='#667eea')
-            
-            ax.set_title('Daily Commit Activity', fontsize=14, fontweight='bold', pad=20)
-            ax.set_xlabel('Date', fontsize=10)
-            ax.set_ylabel('Commits', fontsize=10)
-            ax.grid(True, alpha=0.3)
+            dates = np.array([date_str for date_str, _ in items], dtype='datetime64[D]')
+            commits = np.fromiter((count for _, count in items), dtype=np.int64, count=len(items))
             
-            # Format dates
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
-            ax.xaxis.set_major_locator(mdates.DayLocator(interval=1))
-            plt.xticks(rotation=45)
-            
-            plt.tight_layout()
-            
-            # Convert to base64
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-            buffer.seek(0)
-            chart_base64 = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
+            # The figure and PNG buffer are shared, so render one chart at a time
+            with self._render_lock:
+                # Create chart on the reusable figure
+                fig = self._get_chart_figure()
+                fig.clear()
+                ax = fig.add_subplot(111)
+                ax.plot(dates, commits, marker='o', linewidth=2, markersize=6, color='#667eea')
+                ax.fill_between(dates, commits, alpha=0.3, color='#667eea')
+                
+                ax.set_title('Daily Commit Activity', fontsize=14, fontweight='bold', pad=20)
+                ax.set_xlabel('Date', fontsize=10)
+                ax.set_ylabel('Commits', fontsize=10)
+                ax.grid(True, alpha=0.3)
+                
+                # Format dates
+                ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
+                ax.xaxis.set_major_locator(mdates.DayLocator(interval=1))
+                ax.tick_params(axis='x', labelrotation=45)
+                
+                fig.tight_layout()
+                
+                # Convert to base64 via the reusable PNG buffer
+                buffer = self._png_buffer
+                buffer.seek(0)
+                buffer.truncate(0)
+                fig.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
+                chart_base64 = base64.b64encode(buffer.getvalue()).decode()
             
-            return f'''
+            chart_html = f'''
             <div class="chart-container">
                 <img src="data:image/png;base64,{chart_base64}" alt="Daily Commit Activity" class="chart-image">
             </div>
             '''
             
+            with self._cache_lock:
+                self.chart_cache[cache_key] = chart_html
+                self.chart_cache.move_to_end(cache_key)
+                while len(self.chart_cache) > CHART_CACHE_SIZE:
+                    self.chart_cache.popitem(last=False)
+            
+            return chart_html
+            
         except Exception as e:
             logger.warning(f"Failed to generate commits chart: {e}")
             return ""
@@ -839,16 +994,18 @@ class WeeklyReportEmailTemplate:
         
         # Create simple ASCII chart
         max_commits = max(commits_by_day.values()) if commits_by_day else 1
-        chart_html = '<div class="section"><h2 class="section-title"><span class="icon">📊</span>Activity Trends</h2>'
-        chart_html += '<div style="font-family: monospace; font-size: 12px; background: #f8f9fa; padding: 15px; border-radius: 6px; overflow-x: auto;">'
-        
-        for date_str, count in sorted(commits_by_day.items())[-7:]:  # Last 7 days
-            bar_length = int((count / max_commits) * 20) if max_commits > 0 else 0
-            bar = '█' * bar_length + '░' * (20 - bar_length)
-            chart_html += f'{date_str}: {bar} {count}<br>'
-        
-        chart_html += '</div></div>'
-        return chart_html
+        parts = [
+            '<div class="section"><h2 class="section-title"><span class="icon">📊</span>Activity Trends</h2>',
+            '<div style="font-family: monospace; font-size: 12px; background: #f8f9fa; padding: 15px; border-radius: 6px; overflow-x: auto;">'
+        ]
+        
+        for date_str, count in reversed(heapq.nlargest(7, commits_by_day.items())):  # Last 7 days
+            bar_length = int((count / max_commits) * TEXT_BAR_WIDTH) if max_commits > 0 else 0
+            bar = _FULL_BAR[:bar_length] + _EMPTY_BAR[bar_length:]
+            parts.append(f'{date_str}: {bar} {count}<br>')
+        
+        parts.append('</div></div>')
+        return "".join(parts)
     
     def _generate_insights_section(self, insights: Dict) -> str:
         """Generate insights and recommendations section."""
@@ -856,22 +1013,24 @@ class WeeklyReportEmailTemplate:
         focus_areas = insights.get('team_focus_areas', [])
         coaching = insights.get('individual_coaching', [])
         
-        content_html = ""
+        parts = []
         
         if actions:
-            content_html += "<h4 style='color: #495057; margin-bottom: 8px;'>🎯 Recommended Actions</h4>"
-            content_html += "<ul class='insights-list'>"
+            parts.append("<h4 style='color: #495057; margin-bottom: 8px;'>🎯 Recommended Actions</h4>")
+            parts.append("<ul class='insights-list'>")
             for action in actions[:3]:  # Top 3 actions
-                priority_class = f"priority-{action.get('priority', 'medium')}"
-                content_html += f"<li class='{priority_class}'>{action.get('action', 'Action needed')}</li>"
-            content_html += "</ul>"
+                priority = _escape(action.get('priority', 'medium'))
+                action_text = _escape(action.get('action', 'Action needed'))
+                parts.append(f"<li class='priority-{priority}'>{action_text}</li>")
+            parts.append("</ul>")
         
         if focus_areas:
-            content_html += "<h4 style='color: #495057; margin: 15px 0 8px 0;'>🎯 Team Focus Areas</h4>"
-            content_html += "<ul style='margin: 5px 0 0 20px; font-size: 13px;'>"
+            parts.append("<h4 style='color: #495057; margin: 15px 0 8px 0;'>🎯 Team Focus Areas</h4>")
+            parts.append("<ul style='margin: 5px 0 0 20px; font-size: 13px;'>")
             for area in focus_areas[:3]:
-                content_html += f"<li style='margin-bottom: 5px;'>{area}</li>"
-            content_html += "</ul>"
+                parts.append(f"<li style='margin-bottom: 5px;'>{_escape(area)}</li>")
+            parts.append("</ul>")
+        content_html = "".join(parts)
         
         return f"""
         <div class="section">
@@ -897,31 +1056,28 @@ class WeeklyReportEmailTemplate:
         if not by_author:
             return "<em>No activity this week</em>"
         
-        sorted_authors = sorted(by_author.items(), key=lambda x: x[1], reverse=True)[:5]
-        result = ""
-        for author, commits in sorted_authors:
-            result += f"<div style='margin-bottom: 3px;'><strong>{author}</strong>: {commits} commits</div>"
-        
-        return result
+        sorted_authors = heapq.nlargest(5, by_author.items(), key=itemgetter(1))
+        return "".join(
+            f"<div style='margin-bottom: 3px;'><strong>{_escape(author)}</strong>: {commits} commits</div>"
+            for author, commits in sorted_authors
+        )
     
     def _format_top_contributors_from_tables(self, aggregated_contributors: Dict) -> str:
         """Format top contributors list from aggregated detailed table data."""
         if not aggregated_contributors:
             return "<em>No activity this week</em>"
         
-        # Sort by total commits
-        sorted_contributors = sorted(
-            aggregated_contributors.items(), 
-            key=lambda x: x[1]['commits'], 
-            reverse=True
-        )[:5]
-        
-        result = ""
-        for contributor, data in sorted_contributors:
-            commits = data['commits']
-            result += f"<div style='margin-bottom: 3px;'><strong>{contributor}</strong>: {commits} commits</div>"
-        
-        return result
+        # Top 5 by total commits
+        sorted_contributors = heapq.nlargest(
+            5,
+            aggregated_contributors.items(),
+            key=lambda x: x[1]['commits']
+        )
+        
+        return "".join(
+            f"<div style='margin-bottom: 3px;'><strong>{_escape(contributor)}</strong>: {data['commits']} commits</div>"
+            for contributor, data in sorted_contributors
+        )
     
     def _aggregate_contributors_from_tables(self, contrib_data: List[Dict]) -> Dict[str, Dict]:
         """Aggregate contributor data from detailed tables by contributor name."""
@@ -954,22 +1110,15 @@ class WeeklyReportEmailTemplate:
     
     def _format_project_card(self, project: Dict) -> str:
         """Format individual project card."""
-        health_class = f"health-{project['health_status']}"
         metrics = project.get('metrics', {})
         
-        return f"""
-        <div class="project-card">
-            <div class="project-name">{project['name']}</div>
-            <div class="project-health">
-                <span class="health-badge {health_class}">{project['health_status'].title()}</span>
-                <span style="font-size: 11px; color: #6c757d;">Score: {project['health_score']}</span>
-            </div>
-            <div class="project-metrics">
-                {metrics.get('commits_this_week', 0)} commits • 
-                {metrics.get('open_issues', 0)} open issues
-            </div>
-        </div>
-        """
+        return _render_project_card(
+            project['name'],
+            project['health_status'],
+            project['health_score'],
+            metrics.get('commits_this_week', 0),
+            metrics.get('open_issues', 0)
+        )
     
     def _generate_detailed_tables_section(self, tables: Dict[str, List[Dict]]) -> str:
         """Generate detailed activity tables section for email."""
@@ -977,13 +1126,17 @@ class WeeklyReportEmailTemplate:
         contrib_data = tables.get('project_contributor_activity', [])
         
         # Separate active and inactive data
-        active_branches = [item for item in branch_data if item.get('commits_total', item.get('commits', 0)) > 0]
-        inactive_branches = [item for item in branch_data if item.get('commits_total', item.get('commits', 0)) == 0]
+        # Resolve each branch's commit count once; newer reports provide 'commits_total'
+        active_branches = []
+        for item in branch_data:
+            commits_total = item['commits_total'] if 'commits_total' in item else item.get('commits', 0)
+            if commits_total > 0:
+                active_branches.append((commits_total, item))
         active_contribs = [item for item in contrib_data if item['commits'] > 0 or item['mrs'] > 0 or item['net_lines'] != 0]
         inactive_contribs = [item for item in contrib_data if item['commits'] == 0 and item['mrs'] == 0 and item['net_lines'] == 0]
         
         # Sort active data
-        active_branches.sort(key=lambda x: (x.get('commits_total', x.get('commits', 0)), x['contributors'], x['net_lines']), reverse=True)
+        active_branches.sort(key=lambda x: (x[0], x[1]['contributors'], x[1]['net_lines']), reverse=True)
         active_contribs.sort(key=lambda x: (x['contributor'], -(x['commits'] + x['mrs'])))
         
         content_html = ""
@@ -1007,17 +1160,17 @@ class WeeklyReportEmailTemplate:
             """
             
             # Limit to top 15 for email
-            for item in active_branches[:15]:
+            for commits_total, item in active_branches[:15]:
                 net_lines = item['net_lines']
                 lines_str = f"+{net_lines}" if net_lines > 0 else str(net_lines)
                 lines_class = "lines-positive" if net_lines > 0 else "lines-negative"
                 
                 content_html += f"""
                 <tr>
-                    <td>{item['group'][:12]}</td>
-                    <td>{item['project'][:18]}</td>
-                    <td>{item['branch'][:10]}</td>
-                    <td style="text-align: center;">{item.get('commits_total', item.get('commits', 0))}</td>
+                    <td>{_escape(item['group'][:12])}</td>
+                    <td>{_escape(item['project'][:18])}</td>
+                    <td>{_escape(item['branch'][:10])}</td>
+                    <td style="text-align: center;">{commits_total}</td>
                     <td style="text-align: center;">{item['contributors']}</td>
                     <td style="text-align: center;" class="{lines_class}">{lines_str}</td>
                 </tr>
@@ -1063,9 +1216,9 @@ class WeeklyReportEmailTemplate:
                 
                 content_html += f"""
                 <tr>
-                    <td>{item['contributor'][:12] if item['contributor'] != '-' else '-'}</td>
-                    <td>{item['project'][:15]}</td>
-                    <td>{item['group'][:12]}</td>
+                    <td>{_escape(item['contributor'][:12]) if item['contributor'] != '-' else '-'}</td>
+                    <td>{_escape(item['project'][:15])}</td>
+                    <td>{_escape(item['group'][:12])}</td>
                     <td style="text-align: center;">{item['commits']}</td>
                     <td style="text-align: center;">{item['mrs']}</td>
                     <td style="text-align: center;" class="{lines_class}">{lines_str}</td>
@@ -1096,9 +1249,9 @@ class WeeklyReportEmailTemplate:
                 unique_projects = sorted(list(projects))
                 content_html += f"""
                 <div class="inactive-group">
-                    <h5>{group}</h5>
+                    <h5>{_escape(group)}</h5>
                     <div class="inactive-projects">
-                        {len(unique_projects)} inactive projects: {', '.join(unique_projects[:6])}
+                        {len(unique_projects)} inactive projects: {_escape(', '.join(unique_projects[:6]))}
                         {'...' if len(unique_projects) > 6 else ''}
                     </div>
                 </div>
@@ -1130,4 +1283,30 @@ class WeeklyReportEmailTemplate:
             </h2>
             {content_html}
         </div>
-        """ if content_html else ""
\ No newline at end of file
+        """ if content_html else ""
+
+
+# Shared renderer so caches, figure and buffer persist across calls
+_TEMPLATE_RENDERER = WeeklyReportEmailTemplate()
+
+
+def render_weekly_report_email(
+    report_data: Dict[str, Any],
+    team_name: str = "Development Team",
+    include_charts: bool = True
+) -> str:
+    """Generate a weekly report HTML email using the shared template renderer.
+    
+    Args:
+        report_data: Report data from WeeklyProductivityReporter
+        team_name: Name of the team for the report
+        include_charts: Whether to include embedded charts
+        
+    Returns:
+        Complete HTML email content
+    """
+    return _TEMPLATE_RENDERER.generate_html_email(
+        report_data,
+        team_name=team_name,
+        include_charts=include_charts
+    )
@@ -48,7 +48,7 @@ class FileCache:
             return None
         
         try:
-            with open(cache_file, 'r') as f:
+            with open(cache_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
             # Check expiry
@@ -86,8 +86,9 @@ class FileCache:
                 'created': datetime.now().isoformat()
             }
             
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            # Cache files are only read back by this class, so write compact JSON
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'), default=str)
             
             logger.debug(f"Cached key: {key} (TTL: {ttl}s)")
             
@@ -122,7 +123,7 @@ class FileCache:
         
         for cache_file in self.cache_dir.glob("*.json"):
             try:
-                with open(cache_file, 'r') as f:
+                with open(cache_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                 
                 expiry = datetime.fromisoformat(data['expiry'])
@@ -159,7 +160,7 @@ class FileCache:
             total_size += cache_file.stat().st_size
             
             try:
-                with open(cache_file, 'r') as f:
+                with open(cache_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                 
                 expiry = datetime.fromisoformat(data['expiry'])
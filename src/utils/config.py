@@ -2,6 +2,7 @@
 
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 
@@ -22,6 +23,12 @@ except ImportError:
                         os.environ[key.strip()] = value.strip()
 
 
+@lru_cache(maxsize=1)
+def _load_env_file() -> None:
+    """Load the .env file into the environment once per process."""
+    load_dotenv()
+
+
 class Config:
     """Configuration manager that merges YAML config with environment variables."""
     
@@ -31,8 +38,8 @@ class Config:
         Args:
             config_path: Path to YAML configuration file
         """
-        # Load environment variables
-        load_dotenv()
+        # Load environment variables (the .env file is only parsed once)
+        _load_env_file()
         
         # Find config file
         if config_path:
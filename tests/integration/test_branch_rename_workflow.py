@@ -2,11 +2,6 @@
 
 import pytest
 from unittest.mock import Mock, patch
-from pathlib import Path
-import sys
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from scripts.rename_branches import BranchRenamer, main
 from src.api import GitLabClient
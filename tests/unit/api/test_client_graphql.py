@@ -0,0 +1,117 @@
+"""Unit tests for GitLab client GraphQL support."""
+
+import pytest
+from unittest.mock import patch
+
+from src.api.client import GitLabClient
+from src.api.exceptions import GitLabAPIError
+
+
+class TestGitLabClientGraphQL:
+    """Test GraphQL queries and batched issue creation."""
+    
+    @pytest.fixture
+    def mock_request(self, mock_response):
+        """Patch HTTP requests, answering the client's authentication check."""
+        with patch('requests.Session.request') as mock_request:
+            mock_request.side_effect = [mock_response(json_data={'id': 1, 'username': 'user'})]
+            yield mock_request
+    
+    def test_create_issues_batch(self, mock_request, mock_response):
+        """Test creating several issues in one GraphQL mutation."""
+        client = GitLabClient("https://gitlab.example.com", "token")
+        mock_request.side_effect = [
+            mock_response(json_data={'data': {
+                'i0': {'issue': {'iid': '7', 'webUrl': 'https://gitlab.example.com/g/p/-/issues/7'}, 'errors': []},
+                'i1': {'issue': None, 'errors': ['Title is too long']}
+            }})
+        ]
+        
+        results = client.create_issues_batch('g/p', [
+            {'title': 'First', 'labels': ['bug']},
+            {'title': 'Second', 'description': 'Details'}
+        ])
+        
+        assert results[0]['issue']['iid'] == '7'
+        assert results[1]['errors'] == ['Title is too long']
+        
+        method, url = mock_request.call_args[0]
+        payload = mock_request.call_args[1]['json']
+        assert (method, url) == ('POST', 'https://gitlab.example.com/api/graphql')
+        assert payload['query'].count('createIssue(') == 2
+        assert payload['variables']['i0'] == {'projectPath': 'g/p', 'title': 'First', 'labels': ['bug']}
+        assert payload['variables']['i1']['description'] == 'Details'
+    
+    def test_create_issues_batch_is_not_retried(self, mock_request, mock_response):
+        """Test that the mutation goes through the session that never retries."""
+        client = GitLabClient("https://gitlab.example.com", "token")
+        mock_request.side_effect = [
+            mock_response(json_data={'data': {'i0': {'issue': {'iid': '1', 'webUrl': 'url'}, 'errors': []}}})
+        ]
+        
+        with patch.object(client.session, 'request') as retrying_request:
+            client.create_issues_batch('g/p', [{'title': 'First'}])
+        
+        retrying_request.assert_not_called()
+        assert mock_request.call_count == 2
+        assert client.mutation_session.get_adapter(client.graphql_url).max_retries.total == 0
+        assert client.session.get_adapter(client.graphql_url).max_retries.total == 3
+    
+    def test_create_issues_batch_maps_metadata(self, mock_request, mock_response):
+        """Test that weight, milestone and assignees map onto CreateIssueInput."""
+        client = GitLabClient("https://gitlab.example.com", "token")
+        mock_request.side_effect = [
+            mock_response(json_data={'data': {'i0': {'issue': {'iid': '1', 'webUrl': 'url'}, 'errors': []}}})
+        ]
+        
+        client.create_issues_batch('g/p', [
+            {'title': 'First', 'weight': 3, 'milestone_id': 12, 'assignee_ids': [45]}
+        ])
+        
+        issue_input = mock_request.call_args[1]['json']['variables']['i0']
+        assert issue_input['weight'] == 3
+        assert issue_input['milestoneId'] == 'gid://gitlab/Milestone/12'
+        assert issue_input['assigneeIds'] == ['gid://gitlab/User/45']
+    
+    def test_create_issues_batch_partial_errors(self, mock_request, mock_response):
+        """Test that top-level errors only fail the aliases they name."""
+        client = GitLabClient("https://gitlab.example.com", "token")
+        mock_request.side_effect = [
+            mock_response(json_data={
+                'data': {
+                    'i0': {'issue': {'iid': '7', 'webUrl': 'url7'}, 'errors': []},
+                    'i1': None,
+                    'i2': {'issue': {'iid': '8', 'webUrl': 'url8'}, 'errors': []}
+                },
+                'errors': [{'message': 'Milestone not found', 'path': ['i1']}]
+            })
+        ]
+        
+        results = client.create_issues_batch('g/p', [
+            {'title': 'First'},
+            {'title': 'Second'},
+            {'title': 'Third'}
+        ])
+        
+        assert [r['issue']['iid'] if r['issue'] else None for r in results] == ['7', None, '8']
+        assert results[1]['errors'] == ['Milestone not found']
+    
+    def test_create_issues_batch_without_data(self, mock_request, mock_response):
+        """Test that a response without data raises."""
+        client = GitLabClient("https://gitlab.example.com", "token")
+        mock_request.side_effect = [
+            mock_response(json_data={'data': None, 'errors': [{'message': 'Syntax error'}]})
+        ]
+        
+        with pytest.raises(GitLabAPIError, match='Syntax error'):
+            client.create_issues_batch('g/p', [{'title': 'First'}])
+    
+    def test_graphql_raises_on_errors(self, mock_request, mock_response):
+        """Test that plain GraphQL queries raise on any top-level error."""
+        client = GitLabClient("https://gitlab.example.com", "token")
+        mock_request.side_effect = [
+            mock_response(json_data={'data': {'project': None}, 'errors': [{'message': 'Denied'}]})
+        ]
+        
+        with pytest.raises(GitLabAPIError, match='Denied'):
+            client.graphql('query { project(fullPath: "g/p") { id } }')
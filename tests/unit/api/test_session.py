@@ -0,0 +1,18 @@
+"""Unit tests for pooled report sessions."""
+
+from src.api.session import get_session
+
+
+class TestGetSession:
+    """Test pooled session helper."""
+    
+    def test_session_reused_per_token(self):
+        """Test that one session is shared per token."""
+        assert get_session('token-a') is get_session('token-a')
+        assert get_session('token-a') is not get_session('token-b')
+    
+    def test_session_bearer_header(self):
+        """Test that the session authenticates with a bearer token."""
+        session = get_session('token-c')
+        
+        assert session.headers['Authorization'] == 'Bearer token-c'
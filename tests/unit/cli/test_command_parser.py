@@ -114,20 +114,18 @@ class TestCommandParser:
             for key, value in expected_params.items():
                 assert result.parameters.get(key) == value
     
-    def test_parse_command_aliases(self):
+    @pytest.mark.parametrize("command,expected_script", [
+        ("add issues for project 123", "scripts/create_issues.py"),
+        ("make dashboard for groups 1,2", "scripts/generate_executive_dashboard.py"),
+        ("team report for group 5", "scripts/weekly_reports.py"),
+        ("analysis project 123", "scripts/analyze_projects.py")
+    ])
+    def test_parse_command_aliases(self, command, expected_script):
         """Test parsing command aliases."""
-        aliases_tests = [
-            ("add issues for project 123", "scripts/create_issues.py"),
-            ("make dashboard for groups 1,2", "scripts/generate_executive_dashboard.py"),
-            ("team report for group 5", "scripts/weekly_reports.py"),
-            ("analysis project 123", "scripts/analyze_projects.py")
-        ]
+        result = self.parser.parse(command)
         
-        for command, expected_script in aliases_tests:
-            result = self.parser.parse(command)
-            
-            assert result is not None
-            assert result.command.script_path == expected_script
+        assert result is not None
+        assert result.command.script_path == expected_script
     
     def test_fuzzy_matching(self):
         """Test fuzzy matching for partially matching commands."""
@@ -297,18 +295,15 @@ class TestCommandParser:
             assert result is not None
             assert len(result.parameters) > 0
     
-    def test_case_insensitive_parsing(self):
+    @pytest.mark.parametrize("command", [
+        "CREATE ISSUES FOR PROJECT 123",
+        "Create Issues For Project 123",
+        "create issues for project 123",
+        "CrEaTe IsSuEs FoR pRoJeCt 123"
+    ])
+    def test_case_insensitive_parsing(self, command):
         """Test that parsing is case insensitive."""
-        case_variants = [
-            "CREATE ISSUES FOR PROJECT 123",
-            "Create Issues For Project 123",
-            "create issues for project 123",
-            "CrEaTe IsSuEs FoR pRoJeCt 123"
-        ]
-        
-        results = [self.parser.parse(command) for command in case_variants]
+        result = self.parser.parse(command)
         
-        # All should parse successfully
-        for result in results:
-            assert result is not None
-            assert result.parameters.get("project_id") == "123" 
\ No newline at end of file
+        assert result is not None
+        assert result.parameters.get("project_id") == "123" 
\ No newline at end of file
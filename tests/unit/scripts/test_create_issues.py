@@ -2,12 +2,8 @@
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock, mock_open
-from pathlib import Path
 import csv
 import json
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 
 class TestIssueCreation:
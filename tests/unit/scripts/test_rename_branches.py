@@ -2,10 +2,6 @@
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock, call
-from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 
 class TestBranchRenaming:
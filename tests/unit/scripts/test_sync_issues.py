@@ -2,15 +2,9 @@
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock, mock_open
-from pathlib import Path
 import json
-import subprocess
 
-# Mock the script module for testing
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-
-from scripts.sync_issues import IssueFile, get_issue_files, generate_curl_command, create_issue_with_curl, sync_issues
+from scripts.sync_issues import IssueFile, get_issue_files, build_issues_url, generate_curl_command, create_issue_with_curl, create_issues_with_graphql, sync_issues
 
 
 class TestIssueFile:
@@ -105,6 +99,43 @@ Description here.
         assert data['labels'] == "bug,urgent"
         assert data['assignee'] == "john.doe"
         assert "Description here" in data['description']
+    
+    def test_frontmatter_with_bom(self, tmp_path):
+        """Test frontmatter is detected in files saved with a UTF-8 BOM."""
+        test_file = tmp_path / "bom.md"
+        test_file.write_bytes(b"\xef\xbb\xbf---\ntitle: BOM Issue\n---\nBody")
+        
+        issue = IssueFile(test_file)
+        
+        assert issue.title == "BOM Issue"
+        assert issue.description == "Body"
+    
+    def test_heading_does_not_span_lines(self, tmp_path):
+        """Test an empty heading line is not joined with the following line."""
+        test_file = tmp_path / "empty-heading.md"
+        test_file.write_text("#   \nNot a heading\n\n# Real Heading\nBody")
+        
+        issue = IssueFile(test_file)
+        
+        assert issue.title == "Real Heading"
+        assert "Not a heading" in issue.description
+    
+    def test_labels_deduplicated_in_order(self, tmp_path):
+        """Test duplicate labels are removed while keeping first-seen order."""
+        content = """---
+labels: [urgent, bug]
+---
+
+# Title
+
+Needs a fix #bug #backend #urgent #docs
+"""
+        test_file = tmp_path / "test.md"
+        test_file.write_text(content)
+        
+        issue = IssueFile(test_file)
+        
+        assert issue.labels == ['urgent', 'bug', 'backend', 'docs']
 
 
 class TestGetIssueFiles:
@@ -127,6 +158,16 @@ class TestGetIssueFiles:
         assert "issue3.markdown" in filenames
         assert "not-an-issue.py" not in filenames
     
+    def test_skips_dotfiles(self, tmp_path):
+        """Test that hidden drafts and editor backups are not synced."""
+        (tmp_path / "issue1.md").write_text("# Issue 1")
+        (tmp_path / ".draft.md").write_text("# Draft")
+        (tmp_path / ".issue1.md.swp.txt").write_text("swap")
+        
+        issues = get_issue_files(tmp_path)
+        
+        assert [issue.filename for issue in issues] == ["issue1.md"]
+    
     def test_empty_directory(self, tmp_path):
         """Test handling empty directory."""
         issues = get_issue_files(tmp_path)
@@ -150,6 +191,18 @@ class TestGetIssueFiles:
 class TestGenerateCurlCommand:
     """Test generate_curl_command function."""
     
+    def test_build_issues_url_encodes_project_path(self):
+        """Test path-style project IDs are URL-encoded."""
+        assert build_issues_url("https://gitlab.example.com", "123") == \
+            "https://gitlab.example.com/api/v4/projects/123/issues"
+        assert build_issues_url("https://gitlab.example.com", "group/sub/project") == \
+            "https://gitlab.example.com/api/v4/projects/group%2Fsub%2Fproject/issues"
+    
+    def test_build_issues_url_keeps_encoded_project_path(self):
+        """Test an already-encoded project path is not encoded twice."""
+        assert build_issues_url("https://gitlab.example.com", "group%2Fsub%2Fproject") == \
+            "https://gitlab.example.com/api/v4/projects/group%2Fsub%2Fproject/issues"
+    
     def test_basic_curl_command(self, tmp_path):
         """Test generating basic curl command."""
         content = """---
@@ -208,7 +261,7 @@ class TestCreateIssueWithCurl:
         """Test successful issue creation."""
         # Mock successful response
         mock_run.return_value = MagicMock(
-            stdout='{"iid": 123, "web_url": "https://gitlab.example.com/issues/123"}',
+            stdout='{"iid": 123, "web_url": "https://gitlab.example.com/issues/123"}\n201',
             stderr='',
             returncode=0
         )
@@ -233,8 +286,10 @@ class TestCreateIssueWithCurl:
     def test_curl_failure(self, mock_run, tmp_path):
         """Test handling curl failure."""
         # Mock failed response
-        mock_run.side_effect = subprocess.CalledProcessError(
-            1, 'curl', stderr='Connection failed'
+        mock_run.return_value = MagicMock(
+            stdout='',
+            stderr='Connection failed',
+            returncode=7
         )
         
         content = "---\ntitle: Test\n---\nDescription"
@@ -252,6 +307,54 @@ class TestCreateIssueWithCurl:
         assert success is False
         assert "Curl failed" in message
     
+    @patch('subprocess.run')
+    def test_http_error(self, mock_run, tmp_path):
+        """Test HTTP error status reported by curl's write-out."""
+        mock_run.return_value = MagicMock(
+            stdout='{"message": "403 Forbidden"}\n403',
+            stderr='',
+            returncode=0
+        )
+        
+        content = "---\ntitle: Test\n---\nDescription"
+        test_file = tmp_path / "test.md"
+        test_file.write_text(content)
+        issue = IssueFile(test_file)
+        
+        success, message = create_issue_with_curl(
+            issue,
+            "https://gitlab.example.com",
+            "project-123",
+            "token"
+        )
+        
+        assert success is False
+        assert message == "HTTP 403: 403 Forbidden"
+    
+    @patch('subprocess.run')
+    def test_http_error_non_json_body(self, mock_run, tmp_path):
+        """Test the HTTP status is kept when the error body isn't JSON."""
+        mock_run.return_value = MagicMock(
+            stdout='<html><body>502 Bad Gateway</body></html>\n502',
+            stderr='',
+            returncode=0
+        )
+        
+        content = "---\ntitle: Test\n---\nDescription"
+        test_file = tmp_path / "test.md"
+        test_file.write_text(content)
+        issue = IssueFile(test_file)
+        
+        success, message = create_issue_with_curl(
+            issue,
+            "https://gitlab.example.com",
+            "project-123",
+            "token"
+        )
+        
+        assert success is False
+        assert message == "HTTP 502: <html><body>502 Bad Gateway</body></html>"
+    
     def test_dry_run(self, tmp_path):
         """Test dry run mode."""
         content = "---\ntitle: Test\n---\nDescription"
@@ -340,6 +443,153 @@ class TestSyncIssues:
         assert len(results['errors']) == 1
         assert "API Error" in results['errors'][0]
     
+    @patch('scripts.sync_issues.create_issue_with_curl')
+    @patch('scripts.sync_issues.get_issue_files')
+    def test_parallel_sync(self, mock_get_files, mock_create, tmp_path):
+        """Test concurrent sync tallies every issue."""
+        issues = []
+        for n in range(6):
+            issue = Mock()
+            issue.filename = f"issue{n}.md"
+            issue.title = f"Issue {n}"
+            issue.labels = []
+            issues.append(issue)
+        
+        mock_get_files.return_value = issues
+        mock_create.side_effect = lambda issue, *args: (
+            (False, "API Error") if issue.filename == "issue3.md" else (True, "Created")
+        )
+        
+        results = sync_issues(
+            tmp_path,
+            "https://gitlab.example.com",
+            "123",
+            "token",
+            max_workers=4
+        )
+        
+        assert results['total'] == 6
+        assert results['success'] == 5
+        assert results['failed'] == 1
+        assert results['errors'] == ["issue3.md: API Error"]
+    
+    @patch('src.api.GitLabClient')
+    @patch('scripts.sync_issues.get_issue_files')
+    def test_api_mode_reuses_client(self, mock_get_files, mock_client_cls, tmp_path):
+        """Test that API mode creates a single client for all issues."""
+        issues = []
+        for n in (1, 2, 3):
+            issue = Mock()
+            issue.filename = f"issue{n}.md"
+            issue.title = f"Issue {n}"
+            issue.labels = []
+            issue.to_dict.return_value = {'title': issue.title}
+            issues.append(issue)
+        
+        mock_get_files.return_value = issues
+        mock_client_cls.return_value.create_issue.return_value = {'iid': 1, 'web_url': 'url'}
+        
+        results = sync_issues(
+            tmp_path,
+            "https://gitlab.example.com",
+            "123",
+            "token",
+            use_curl=False
+        )
+        
+        assert results['success'] == 3
+        mock_client_cls.assert_called_once_with(url="https://gitlab.example.com", token="token")
+        assert mock_client_cls.return_value.create_issue.call_count == 3
+    
+    @patch('src.api.GitLabClient')
+    @patch('scripts.sync_issues.get_issue_files')
+    def test_graphql_batches(self, mock_get_files, mock_client_cls, tmp_path):
+        """Test that batch mode creates issues with one GraphQL request per batch."""
+        issues = []
+        for n in range(5):
+            issue = Mock()
+            issue.filename = f"issue{n}.md"
+            issue.title = f"Issue {n}"
+            issue.description = ""
+            issue.labels = []
+            issue.due_date = None
+            issue.weight = None
+            issue.milestone = None
+            issue.assignee = None
+            issues.append(issue)
+        
+        mock_get_files.return_value = issues
+        client = mock_client_cls.return_value
+        client.get_project.return_value = {'path_with_namespace': 'group/project'}
+        client.create_issues_batch.side_effect = lambda path, batch: [
+            {'issue': None, 'errors': ['Invalid']} if item['title'] == 'Issue 3'
+            else {'issue': {'iid': '1', 'webUrl': 'url'}, 'errors': []}
+            for item in batch
+        ]
+        
+        results = sync_issues(
+            tmp_path,
+            "https://gitlab.example.com",
+            "123",
+            "token",
+            use_curl=False,
+            batch_size=2
+        )
+        
+        assert results['success'] == 4
+        assert results['errors'] == ["issue3.md: API Error: Invalid"]
+        assert client.create_issues_batch.call_count == 3
+        client.create_issues_batch.assert_called_with('group/project', [
+            {'title': 'Issue 4', 'description': '', 'labels': [], 'due_date': None}
+        ])
+        client.create_issue.assert_not_called()
+    
+    def test_graphql_batch_maps_metadata(self, tmp_path):
+        """Test that numeric metadata is batched and named metadata falls back to REST."""
+        numeric = tmp_path / "numeric.md"
+        numeric.write_text("---\ntitle: Numeric\nweight: 3\nmilestone: 12\nassignee: 45\n---\nBody")
+        named = tmp_path / "named.md"
+        named.write_text("---\ntitle: Named\nmilestone: Sprint 1\n---\nBody")
+        
+        client = Mock()
+        client.create_issues_batch.return_value = [{'issue': {'iid': '1', 'webUrl': 'url1'}, 'errors': []}]
+        client.create_issue.return_value = {'iid': '2', 'web_url': 'url2'}
+        
+        outcomes = create_issues_with_graphql(
+            [IssueFile(numeric), IssueFile(named)], 'group/project', client, '123'
+        )
+        
+        assert outcomes == [(True, "Created issue #1: url1"), (True, "Created issue #2: url2")]
+        batch = client.create_issues_batch.call_args[0][1]
+        assert len(batch) == 1
+        assert batch[0]['weight'] == 3
+        assert batch[0]['milestone_id'] == 12
+        assert batch[0]['assignee_ids'] == [45]
+        client.create_issue.assert_called_once()
+        assert client.create_issue.call_args[0][0] == '123'
+    
+    def test_graphql_batch_keeps_file_order(self, tmp_path):
+        """Test that the batch is split at REST fallbacks so issues are created in file order."""
+        files = []
+        for name, milestone in [("a", "1"), ("b", "Sprint 1"), ("c", "2"), ("d", "3")]:
+            path = tmp_path / f"{name}.md"
+            path.write_text(f"---\ntitle: {name}\nmilestone: {milestone}\n---\nBody")
+            files.append(IssueFile(path))
+        
+        client = Mock()
+        client.create_issues_batch.side_effect = lambda path, batch: [
+            {'issue': {'iid': item['title'], 'webUrl': 'url'}, 'errors': []} for item in batch
+        ]
+        client.create_issue.return_value = {'iid': 'b', 'web_url': 'url'}
+        
+        outcomes = create_issues_with_graphql(files, 'group/project', client, '123')
+        
+        assert [message.split()[2] for _, message in outcomes] == ['#a:', '#b:', '#c:', '#d:']
+        assert [name for name, _, _ in client.mock_calls] == [
+            'create_issues_batch', 'create_issue', 'create_issues_batch'
+        ]
+        assert [item['title'] for item in client.create_issues_batch.call_args[0][1]] == ['c', 'd']
+    
     @patch('builtins.open', new_callable=mock_open)
     @patch('scripts.sync_issues.get_issue_files')
     def test_generate_script(self, mock_get_files, mock_file, tmp_path):
@@ -0,0 +1,95 @@
+"""Unit tests for issue service."""
+
+import pytest
+from unittest.mock import Mock
+
+from src.services.issue_service import IssueService, TEXT_SECTION_SEPARATOR
+from src.api.client import GitLabClient
+from src.utils.validators import ValidationError
+
+
+LEGACY_TEXT = f"""High-Level GitLab Issues
+{TEXT_SECTION_SEPARATOR}
+[Feature] Login page
+Description: Build the login form
+Acceptance Criteria: Users can sign in
+Labels: ui, auth
+{TEXT_SECTION_SEPARATOR}
+[Task] Setup CI
+Description: Configure pipelines
+{TEXT_SECTION_SEPARATOR}
+Notes without a tagged title
+"""
+
+
+class TestIssueService:
+    """Test issue service functionality."""
+    
+    @pytest.fixture
+    def issue_service(self):
+        """Issue service instance with mock client."""
+        return IssueService(Mock(spec=GitLabClient))
+    
+    def test_parse_text_format(self, issue_service):
+        """Test parsing the legacy text format."""
+        issues = issue_service.parse_text_format(LEGACY_TEXT)
+        
+        assert issues == [
+            {
+                'title': 'Login page',
+                'labels': ['feature', 'ui', 'auth'],
+                'description': '## Description\nBuild the login form\n\n## Acceptance Criteria\nUsers can sign in'
+            },
+            {
+                'title': 'Setup CI',
+                'labels': ['task'],
+                'description': '## Description\nConfigure pipelines'
+            }
+        ]
+    
+    def test_parse_text_file_matches_text_format(self, issue_service, tmp_path):
+        """Test that streaming a file gives the same result as parsing its content."""
+        text_file = tmp_path / "issues.txt"
+        text_file.write_text(LEGACY_TEXT, encoding='utf-8')
+        
+        assert issue_service.parse_text_file(text_file) == issue_service.parse_text_format(LEGACY_TEXT)
+    
+    def test_parse_text_format_empty(self, issue_service):
+        """Test parsing content with no issues."""
+        assert issue_service.parse_text_format("") == []
+        assert issue_service.parse_text_format(TEXT_SECTION_SEPARATOR) == []
+    
+    def test_parse_text_format_separator_length(self, issue_service):
+        """Test separators of any length and with trailing spaces split sections."""
+        content = LEGACY_TEXT.replace(TEXT_SECTION_SEPARATOR, '__________   ')
+        
+        assert issue_service.parse_text_format(content) == issue_service.parse_text_format(LEGACY_TEXT)
+    
+    def test_parse_text_format_bug_with_indented_fields(self, issue_service):
+        """Test bug sections and indented short-form field markers."""
+        content = "[Bug] Crash on save\n  Description: Stack trace\n  Acceptance: No crash\n  Labels: backend,, urgent\n"
+        
+        assert issue_service.parse_text_format(content) == [
+            {
+                'title': 'Crash on save',
+                'labels': ['bug', 'backend', 'urgent'],
+                'description': '## Description\nStack trace\n\n## Acceptance Criteria\nNo crash'
+            }
+        ]
+    
+    def test_parse_text_file_with_bom(self, issue_service, tmp_path):
+        """Test a leading UTF-8 BOM does not hide the first field marker."""
+        text_file = tmp_path / "issues.txt"
+        text_file.write_bytes(b"\xef\xbb\xbfDescription: Configure pipelines\n[Task] Setup CI\n")
+        
+        issues = issue_service.parse_text_file(text_file)
+        
+        assert issues[0]['description'] == '## Description\nConfigure pipelines'
+    
+    def test_parse_text_file_missing(self, issue_service, tmp_path):
+        """Test a missing or non-file path raises a validation error."""
+        with pytest.raises(ValidationError, match="File not found"):
+            issue_service.parse_text_file(tmp_path / "missing.txt")
+        
+        with pytest.raises(ValidationError, match="Not a file"):
+            issue_service.parse_text_file(tmp_path)
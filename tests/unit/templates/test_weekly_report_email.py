@@ -1,10 +1,11 @@
 """Tests for weekly report email template."""
 
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 from datetime import datetime
 
-from src.templates.weekly_report_email import WeeklyReportEmailTemplate
+from src.templates.weekly_report_email import WeeklyReportEmailTemplate, render_weekly_report_email, _minify_html
 
 
 class TestWeeklyReportEmailTemplate:
@@ -177,6 +178,32 @@ class TestWeeklyReportEmailTemplate:
         assert 'Team Performance' in html
         assert 'Insights & Next Steps' in html
     
+    def test_generate_html_email_minified(self, template, sample_report_data):
+        """Test that inter-tag whitespace is collapsed outside the style block."""
+        html = template.generate_html_email(sample_report_data, include_charts=False)
+        
+        body = html.split('</style>', 1)[1]
+        assert '\n' not in body
+        assert '<body> <div class="email-container">' in html
+        assert template._get_email_styles().strip() in html
+    
+    def test_minify_keeps_space_between_inline_elements(self):
+        """Test that whitespace between inline elements still renders as a space."""
+        html = _minify_html('<p>\n    <strong>12</strong>\n    <span>commits</span>\n</p>')
+        
+        assert html == '<p> <strong>12</strong> <span>commits</span> </p>'
+    
+    def test_render_weekly_report_email(self, sample_report_data):
+        """Test module-level rendering through the shared template."""
+        html = render_weekly_report_email(sample_report_data, team_name="Shared Team", include_charts=False)
+        
+        assert html.startswith('<!DOCTYPE html>')
+        assert 'Shared Team' in html
+    
+    def test_template_has_no_instance_dict(self, template):
+        """Test that template state is limited to its declared slots."""
+        assert not hasattr(template, '__dict__')
+    
     def test_generate_html_email_with_team_name(self, template, sample_report_data):
         """Test HTML generation with custom team name."""
         team_name = "AI Development Team"
@@ -331,8 +358,7 @@ class TestWeeklyReportEmailTemplate:
         assert '12 open issues' in card
         assert 'health-warning' in card
     
-    @patch('src.templates.weekly_report_email.plt')
-    def test_create_commits_chart_with_matplotlib(self, mock_plt, template):
+    def test_create_commits_chart_with_matplotlib(self, template):
         """Test chart creation with matplotlib available."""
         commits_by_day = {
             '2024-01-08': 5,
@@ -343,28 +369,52 @@ class TestWeeklyReportEmailTemplate:
         # Mock matplotlib components
         mock_fig = Mock()
         mock_ax = Mock()
-        mock_plt.subplots.return_value = (mock_fig, mock_ax)
-        mock_plt.savefig = Mock()
-        mock_plt.close = Mock()
+        mock_fig.add_subplot.return_value = mock_ax
         
-        with patch('src.templates.weekly_report_email.BytesIO') as mock_bytesio, \
+        with patch.object(WeeklyReportEmailTemplate, '_get_chart_figure', return_value=mock_fig), \
              patch('src.templates.weekly_report_email.base64.b64encode') as mock_b64:
             
-            mock_buffer = Mock()
-            mock_bytesio.return_value = mock_buffer
             mock_b64.return_value.decode.return_value = 'fake_base64_data'
             
             result = template._create_commits_chart(commits_by_day)
             
-            # Should create chart elements
-            mock_plt.subplots.assert_called_once()
+            # Should reuse the figure and create chart elements
+            mock_fig.clear.assert_called_once()
             mock_ax.plot.assert_called_once()
             mock_ax.fill_between.assert_called_once()
+            mock_fig.savefig.assert_called_once()
             
             # Should return HTML with embedded image
             assert 'chart-image' in result
             assert 'data:image/png;base64,fake_base64_data' in result
     
+    def test_create_commits_chart_reuses_figure(self, template):
+        """Test that the chart figure is created once per template."""
+        pytest.importorskip('matplotlib')
+        
+        assert template._get_chart_figure() is template._get_chart_figure()
+    
+    def test_create_commits_chart_uses_cache(self, template):
+        """Test that repeated charts for the same data are served from cache."""
+        commits_by_day = {'2024-01-08': 5, '2024-01-09': 8}
+        template.chart_cache[tuple(sorted(commits_by_day.items()))] = '<div>cached</div>'
+        
+        result = template._create_commits_chart(dict(reversed(list(commits_by_day.items()))))
+        
+        assert result == '<div>cached</div>'
+    
+    def test_create_commits_chart_cache_thread_safe(self, template):
+        """Test that concurrent renders keep the chart cache within its bound."""
+        pytest.importorskip('matplotlib')
+        
+        series = [{'2024-01-08': n, '2024-01-09': n + 1} for n in range(4)]
+        with patch('src.templates.weekly_report_email.CHART_CACHE_SIZE', 2):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(template._create_commits_chart, series * 2))
+        
+        assert all('chart-image' in result for result in results)
+        assert len(template.chart_cache) == 2
+    
     def test_create_commits_chart_no_data(self, template):
         """Test chart creation with no data."""
         result = template._create_commits_chart({})
@@ -379,6 +429,14 @@ class TestWeeklyReportEmailTemplate:
         assert 'monospace' in result
         assert '█' in result or '░' in result  # ASCII bar characters
     
+    def test_charts_section_falls_back_without_matplotlib(self, template, sample_report_data):
+        """Test that charts degrade to text when matplotlib is unavailable."""
+        with patch('src.templates.weekly_report_email._load_chart_backend', return_value=None):
+            result = template._generate_charts_section(sample_report_data)
+        
+        assert 'Activity Trends' in result
+        assert 'chart-image' not in result
+    
     def test_html_sanitization(self, template, sample_report_data):
         """Test that generated HTML is safe."""
         # Add potentially dangerous content
@@ -391,7 +449,21 @@ class TestWeeklyReportEmailTemplate:
         
         # Should not contain executable script tags
         assert '<script>' not in html
-        assert 'alert(' not in html
+        assert '&lt;script&gt;alert(&quot;xss&quot;)&lt;/script&gt;' in html
+    
+    def test_escape_user_fields(self, template):
+        """Test that project names are escaped in project cards."""
+        project = {
+            'name': 'R&D <internal>',
+            'health_status': 'healthy',
+            'health_score': 90,
+            'metrics': {}
+        }
+        
+        card = template._format_project_card(project)
+        
+        assert 'R&amp;D &lt;internal&gt;' in card
+        assert '<internal>' not in card
     
     def test_email_styles_completeness(self, template):
         """Test that email styles are comprehensive."""
@@ -54,6 +54,16 @@ class TestFileCache:
         assert cache.get('expire_key') is None
         assert not cache_file.exists()  # Should be deleted
     
+    def test_cache_non_ascii_round_trip(self, temp_dir):
+        """Test non-ASCII values are stored unescaped and read back intact."""
+        cache = FileCache(str(temp_dir / 'cache'))
+        
+        cache.set('thai_key', {'team': 'ทีมพัฒนา'})
+        
+        cache_file = cache.cache_dir / cache._get_cache_key('thai_key')
+        assert 'ทีมพัฒนา' in cache_file.read_text(encoding='utf-8')
+        assert cache.get('thai_key') == {'team': 'ทีมพัฒนา'}
+    
     def test_cache_delete(self, temp_dir):
         """Test deleting cache entries."""
         cache = FileCache(str(temp_dir / 'cache'))
@@ -4,6 +4,8 @@ import pytest
 import os
 from pathlib import Path
 import yaml
+from unittest.mock import patch
+from src.utils import config as config_module
 from src.utils.config import Config
 
 
@@ -201,4 +203,17 @@ class TestConfig:
         # Should also be a copy
         data = test_config.data
         data['test'] = 'value'
-        assert 'test' not in test_config.data
\ No newline at end of file
+        assert 'test' not in test_config.data
+    
+    def test_env_file_loaded_once(self, temp_dir):
+        """Test the .env file is only parsed once across Config instances."""
+        config_module._load_env_file.cache_clear()
+        try:
+            with patch.object(config_module, 'load_dotenv') as mock_load:
+                Config(str(temp_dir / 'missing.yaml'))
+                Config(str(temp_dir / 'missing.yaml'))
+            
+            mock_load.assert_called_once()
+        finally:
+            # Drop the cached mocked call so later Config() instances load .env
+            config_module._load_env_file.cache_clear()